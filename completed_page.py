@@ -5,7 +5,7 @@ Premium Completed Tasks Page
 ----------------------------
 Modern, beautiful design with:
 - Achievement cards
-- Animated task cards
+- Model/view completed tasks table
 - Confetti celebration
 - Stats overview
 - Smooth animations
@@ -17,11 +17,10 @@ Modern, beautiful design with:
 | `user_email`                | Default parameter (manual)     | Current user email, used to fetch user ID |
 | `user_id`                   | Database (`get_user_by_email`) | Unique user identifier |
 | `completed_tasks`           | Database (`get_completed_tasks`) | All completed tasks for this user |
-| `all_tasks`                 | Database (`get_all_tasks`)     | All tasks (pending + completed) for this user |
 | `task["id"]`, `["title"]`, `["deadline"]`, `["duration"]`, `["strategy"]`, `["priority"]`, `["status"]` | Database fields | Real values stored per task |
-| `total_completed`           | Calculated (len of completed)  | Count of completed tasks |
-| `total_tasks`               | Calculated (len of all)        | Total number of tasks |
-| `total_time`                | Calculated (sum of durations)  | Sum of durations of completed tasks |
+| `total_completed`           | Database (`get_completed_stats`) | Count of completed tasks (SQL aggregate) |
+| `total_tasks`               | Database (`get_completed_stats`) | Total number of tasks (SQL aggregate) |
+| `total_time`                | Database (`get_completed_stats`) | Sum of durations of completed tasks (SQL aggregate) |
 | `success_rate`              | Calculated                     | (completed / total) × 100 |
 | `avg_duration`              | Calculated                     | Average duration per completed task |
 | `"No deadline"`             | UI placeholder                 | Displayed if no deadline exists |
@@ -40,144 +39,360 @@ Modern, beautiful design with:
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QTableWidget, QTableWidgetItem,
     QPushButton, QHBoxLayout, QHeaderView, QMessageBox, QFrame,
-    QScrollArea, QGraphicsDropShadowEffect, QGridLayout
+    QGridLayout, QTableView, QAbstractItemView, QStyledItemDelegate
+)
+from PyQt5.QtCore import (
+    Qt, QTimer, QRect, QSize, QEvent,
+    QAbstractTableModel, QModelIndex, QVariant, pyqtSignal
+)
+from PyQt5.QtGui import (
+    QFont, QColor, QPainter, QPen, QLinearGradient, QBrush, QGuiApplication,
+    QPixmap, QPixmapCache
 )
-from PyQt5.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, QRect
-from PyQt5.QtGui import QFont, QColor, QPainter, QPen, QLinearGradient, QBrush
 from database import DatabaseManager
-import random
+from functools import lru_cache
+
+
+# ============================================================
+# 🎨 Stylesheets (module-level so each string is built only once)
+# ============================================================
+_PAGE_QSS = """
+QWidget {
+    background: qlineargradient(
+        x1:0, y1:0, x2:1, y2:1,
+        stop:0 #F0FDF4,
+        stop:0.5 #ECFDF5,
+        stop:1 #D1FAE5
+    );
+}
+"""
+
+_CELEBRATE_BTN_QSS = """
+QPushButton {
+    background: qlineargradient(
+        x1:0, y1:0, x2:1, y2:0,
+        stop:0 #10B981,
+        stop:1 #059669
+    );
+    color: white;
+    border: none;
+    border-radius: 12px;
+    padding: 14px 28px;
+    font-size: 13pt;
+    font-weight: bold;
+}
+QPushButton:hover {
+    background: qlineargradient(
+        x1:0, y1:0, x2:1, y2:0,
+        stop:0 #059669,
+        stop:1 #047857
+    );
+}
+"""
+
+_TABLE_QSS = """
+QTableView {
+    background-color: #FFFFFF;
+    border: 2px solid #E2E8F0;
+    border-radius: 12px;
+    color: #1E293B;
+    font-size: 11pt;
+    selection-background-color: #F0FDF4;
+    selection-color: #1E293B;
+}
+QTableView::item {
+    border-bottom: 1px solid #E2E8F0;
+    padding: 6px;
+}
+QHeaderView::section {
+    background-color: #F8FAFC;
+    color: #64748B;
+    border: none;
+    border-bottom: 2px solid #10B981;
+    padding: 8px;
+    font-weight: 600;
+}
+QScrollBar:vertical {
+    background: rgba(226, 232, 240, 0.5);
+    width: 10px;
+    border-radius: 5px;
+}
+QScrollBar::handle:vertical {
+    background: #10B981;
+    border-radius: 5px;
+}
+QScrollBar::handle:vertical:hover {
+    background: #059669;
+}
+"""
+
+# Badge labels pick up their style from the badge via descendant selectors
+_BADGE_QSS = """
+QFrame#achievementBadge {{
+    background: qlineargradient(
+        x1:0, y1:0, x2:0, y2:1,
+        stop:0 {color},
+        stop:1 {dark}
+    );
+    border-radius: 16px;
+    border-bottom: 4px solid rgba(0, 0, 0, 40);
+    padding: 18px;
+}}
+QLabel {{
+    background: transparent;
+    border: none;
+    color: white;
+}}
+QLabel#badgeTitle {{
+    color: rgba(255,255,255,0.95);
+}}
+"""
+
+_MSGBOX_QSS = """
+QMessageBox {
+    background-color: white;
+}
+QMessageBox QLabel {
+    color: #1E293B;
+    font-size: 11pt;
+}
+QPushButton {
+    background-color: #3B82F6;
+    color: white;
+    border: none;
+    border-radius: 6px;
+    padding: 10px 24px;
+    font-size: 11pt;
+    font-weight: 600;
+    min-width: 80px;
+    min-height: 36px;
+}
+QPushButton:hover {
+    background-color: #2563EB;
+}
+"""
+
+_DELETE_MSGBOX_QSS = """
+QMessageBox {
+    background-color: white;
+}
+QMessageBox QLabel {
+    color: #1E293B;
+    font-size: 11pt;
+}
+QPushButton {
+    background-color: #64748B;
+    color: white;
+    border: none;
+    border-radius: 6px;
+    padding: 10px 24px;
+    font-size: 11pt;
+    font-weight: 600;
+    min-width: 80px;
+    min-height: 36px;
+}
+QPushButton:hover {
+    background-color: #475569;
+}
+"""
+
+_DELETE_BTN_QSS = """
+QPushButton {
+    background-color: #EF4444;
+    color: white;
+    border: none;
+    border-radius: 6px;
+    padding: 10px 24px;
+    font-size: 11pt;
+    font-weight: 600;
+    min-width: 80px;
+    min-height: 36px;
+}
+QPushButton:hover {
+    background-color: #DC2626;
+}
+"""
 
 
 # ============================================================
-# 🎨 Completed Task Card Widget
+# 🔤 Fonts (shared instances; QFont is implicitly shared in Qt)
 # ============================================================
-class CompletedTaskCard(QFrame):
-    def __init__(self, task_id, title, deadline, duration, strategy, parent=None):
+_FONT_ACTION_BTN = QFont("Segoe UI", 10, QFont.DemiBold)
+_FONT_BADGE_VALUE = QFont("Segoe UI", 18, QFont.Bold)
+_FONT_BADGE_TITLE = QFont("Segoe UI", 10)
+_FONT_PAGE_TITLE = QFont("Segoe UI", 28, QFont.Bold)
+_FONT_SUBTITLE = QFont("Segoe UI", 11)
+_FONT_SECTION_TITLE = QFont("Segoe UI", 16, QFont.Bold)
+_FONT_EMPTY_TEXT = QFont("Segoe UI", 14)
+
+
+
+# ============================================================
+# 😀 Emoji Pixmaps (shaped once, then served from QPixmapCache)
+# ============================================================
+def _emoji_pixmap(emoji, size):
+    """Return the emoji rendered into a transparent size×size pixmap"""
+    key = f"completed_emoji:{emoji}:{size}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        pixmap = QPixmap(size, size)
+        pixmap.fill(Qt.transparent)
+        font = QFont("Segoe UI Emoji")
+        font.setPixelSize(int(size * 0.8))
+        painter = QPainter(pixmap)
+        painter.setFont(font)
+        painter.drawText(pixmap.rect(), Qt.AlignCenter, emoji)
+        painter.end()
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+# ============================================================
+# 📋 Completed Tasks Model
+# ============================================================
+class CompletedTasksModel(QAbstractTableModel):
+    """Table model exposing completed task rows to the QTableView."""
+
+    HEADERS = ["", "Task", "Details", "Priority", "Status", "Actions"]
+    ACTIONS_COLUMN = 5
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.task_id = task_id
-        self.setMinimumHeight(140)
-        self.setMaximumHeight(180)
-        self.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #FFFFFF,
-                    stop:1 #F8FAFC
-                );
-                border: 2px solid #E2E8F0;
-                border-left: 1px solid #10B981;
-                border-radius: 12px;
-                padding: 10px;
-            }
-            QFrame:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #F0FDF4,
-                    stop:1 #ECFDF5
-                );
-                border: 2px solid #10B981;
-            }
-        """)
-        
-        # Shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(20)
-        shadow.setColor(QColor(0, 0, 0, 30))
-        shadow.setOffset(0, 5)
-        self.setGraphicsEffect(shadow)
-        
-        main_layout = QHBoxLayout(self)
-        main_layout.setContentsMargins(25, 18, 25, 18)
-        main_layout.setSpacing(20)
-        
-        # Left: Task info
-        info_layout = QVBoxLayout()
-        info_layout.setSpacing(12)
-        info_layout.setContentsMargins(0, 5, 0, 5)
-        
-        # Checkmark + Title
-        title_layout = QHBoxLayout()
-        title_layout.setSpacing(10)
-        
-        check_label = QLabel("✅")
-        check_label.setFont(QFont("Segoe UI", 22))
-        check_label.setFixedWidth(35)
-        check_label.setStyleSheet("background: transparent; border: none;")
-        
-        title_label = QLabel(title)
-        title_label.setFont(QFont("Segoe UI", 14, QFont.Bold))
-        title_label.setWordWrap(True)
-        title_label.setStyleSheet("color: #1E293B; background: transparent; border: none; line-height: 1.4;")
-        
-        title_layout.addWidget(check_label)
-        title_layout.addWidget(title_label, stretch=1)
-        title_layout.addStretch()
-        
-        # Details
-        details_label = QLabel(f"📅 {deadline or 'No deadline'} • ⏱️ {duration} min • 🎯 {strategy or 'No strategy'}")
-        details_label.setFont(QFont("Segoe UI", 11))
-        details_label.setWordWrap(True)
-        details_label.setStyleSheet("color: #64748B; background: transparent; border: none; line-height: 1.5;")
-        
-        info_layout.addLayout(title_layout)
-        info_layout.addWidget(details_label)
-        
-        main_layout.addLayout(info_layout, stretch=3)
-        
-        # Right: Action buttons
-        btn_layout = QHBoxLayout()
-        btn_layout.setSpacing(12)
-        btn_layout.setAlignment(Qt.AlignVCenter)
-        
-        view_btn = QPushButton("👁️ View")
-        restore_btn = QPushButton("↩️ Restore")
-        delete_btn = QPushButton("🗑️ Delete")
-        
-        for btn in [view_btn, restore_btn, delete_btn]:
-            btn.setMinimumSize(100, 42)
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #F1F5F9;
-                    border: 2px solid #E2E8F0;
-                    border-radius: 8px;
-                    font-size: 11pt;
-                    color: #1E293B;
-                    padding: 8px 14px;
-                    font-weight: 600;
-                }
-                QPushButton:hover {
-                    background-color: #3B82F6;
-                    border-color: #2563EB;
-                    color: white;
-                }
-            """)
-        
-        delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #FEE2E2;
-                border: 2px solid #FECACA;
-                border-radius: 8px;
-                font-size: 11pt;
-                color: #DC2626;
-                padding: 8px 14px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: #EF4444;
-                border-color: #DC2626;
-                color: white;
-            }
-        """)
-        
-        self.view_btn = view_btn
-        self.restore_btn = restore_btn
-        self.delete_btn = delete_btn
-        
-        btn_layout.addWidget(view_btn)
-        btn_layout.addWidget(restore_btn)
-        btn_layout.addWidget(delete_btn)
-        
-        main_layout.addLayout(btn_layout)
+        self._rows = []
+        self._display = []  # per-row display strings, formatted once in set_rows
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+        if role == Qt.DecorationRole and index.column() == 0:
+            return _emoji_pixmap("✅", 24)
+        if role != Qt.DisplayRole:
+            return QVariant()
+        if index.column() == self.ACTIONS_COLUMN:
+            return QVariant()
+        return self._display[index.row()][index.column()]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return QVariant()
+
+    def set_rows(self, rows):
+        """Replace all rows with a single model reset."""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._display = [self._format_row(task) for task in self._rows]
+        self.endResetModel()
+
+    @staticmethod
+    def _format_row(task):
+        """Build the display strings of one row (same order as HEADERS)."""
+        return (
+            "",  # check icon is served as a DecorationRole pixmap
+            task["title"],
+            f"📅 {task['deadline'] or 'No deadline'} • "
+            f"⏱️ {task['duration']} min • "
+            f"🎯 {task['strategy'] or 'No strategy'}",
+            f"P{task['priority']}",
+            task["status"].upper(),
+        )
+
+    def task_at(self, row):
+        """Return the task row displayed at the given index."""
+        return self._rows[row]
+
+    def remove_row(self, row):
+        """Remove a single row without resetting the whole model."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        del self._display[row]
+        self.endRemoveRows()
+
+
+# ============================================================
+# 🎨 Row Action Buttons Delegate
+# ============================================================
+class TaskActionsDelegate(QStyledItemDelegate):
+    """Paints View/Restore/Delete buttons and turns clicks into signals."""
+
+    actionTriggered = pyqtSignal(str, int)  # (action, row)
+
+    BUTTONS = (("view", "👁️ View"), ("restore", "↩️ Restore"), ("delete", "🗑️ Delete"))
+    BUTTON_SIZE = (100, 40)
+    BUTTON_SPACING = 12
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._hover = None  # (row, action) currently under the mouse
+
+    def _button_rects(self, rect):
+        width, height = self.BUTTON_SIZE
+        total = len(self.BUTTONS) * width + (len(self.BUTTONS) - 1) * self.BUTTON_SPACING
+        x = rect.x() + max(0, (rect.width() - total) // 2)
+        y = rect.y() + (rect.height() - height) // 2
+        rects = []
+        for action, _ in self.BUTTONS:
+            rects.append((action, QRect(x, y, width, height)))
+            x += width + self.BUTTON_SPACING
+        return rects
+
+    def _action_at(self, rect, pos):
+        for action, button_rect in self._button_rects(rect):
+            if button_rect.contains(pos):
+                return action
+        return None
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)  # row background and separator
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        labels = dict(self.BUTTONS)
+
+        for action, rect in self._button_rects(option.rect):
+            hovered = self._hover == (index.row(), action)
+            if action == "delete":
+                bg, border, fg = ("#EF4444", "#DC2626", "#FFFFFF") if hovered else ("#FEE2E2", "#FECACA", "#DC2626")
+            else:
+                bg, border, fg = ("#3B82F6", "#2563EB", "#FFFFFF") if hovered else ("#F1F5F9", "#E2E8F0", "#1E293B")
+
+            painter.setPen(QPen(QColor(border), 2))
+            painter.setBrush(QColor(bg))
+            painter.drawRoundedRect(rect.adjusted(1, 1, -1, -1), 8, 8)
+
+            painter.setPen(QColor(fg))
+            painter.setFont(_FONT_ACTION_BTN)
+            painter.drawText(rect, Qt.AlignCenter, labels[action])
+
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseMove:
+            action = self._action_at(option.rect, event.pos())
+            hover = (index.row(), action) if action else None
+            if hover != self._hover:
+                self._hover = hover
+                if self.parent() is not None:
+                    self.parent().viewport().update()
+            return False
+
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            action = self._action_at(option.rect, event.pos())
+            if action is None:
+                return False
+            self.actionTriggered.emit(action, index.row())
+            return True
+
+        return False
+
+    def sizeHint(self, option, index):
+        width, height = self.BUTTON_SIZE
+        total = len(self.BUTTONS) * width + (len(self.BUTTONS) - 1) * self.BUTTON_SPACING
+        return QSize(total + 24, height + 24)
 
 
 # ============================================================
@@ -188,116 +403,135 @@ class AchievementBadge(QFrame):
         super().__init__(parent)
         self.setMinimumSize(200, 130)
         self.setMaximumHeight(140)
-        self.setStyleSheet(f"""
-            QFrame {{
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {color},
-                    stop:1 {self.darken_color(color)}
-                );
-                border-radius: 16px;
-                padding: 18px;
-            }}
-        """)
-        
-        # Shadow
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(25)
-        shadow.setColor(QColor(0, 0, 0, 50))
-        shadow.setOffset(0, 8)
-        self.setGraphicsEffect(shadow)
+        self.setObjectName("achievementBadge")
+        self.setStyleSheet(_BADGE_QSS.format(color=color, dark=self.darken_color(color)))
         
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignCenter)
         layout.setSpacing(8)
         layout.setContentsMargins(12, 12, 12, 12)
         
-        icon_label = QLabel(icon)
-        icon_label.setFont(QFont("Segoe UI", 28))
+        icon_label = QLabel()
+        icon_label.setPixmap(_emoji_pixmap(icon, 40))
         icon_label.setAlignment(Qt.AlignCenter)
-        icon_label.setStyleSheet("background: transparent; border: none; color: white;")
         
         value_label = QLabel(str(value))
-        value_label.setFont(QFont("Segoe UI", 18, QFont.Bold))
+        self.value_label = value_label
+        value_label.setFont(_FONT_BADGE_VALUE)
         value_label.setAlignment(Qt.AlignCenter)
         value_label.setWordWrap(True)
-        value_label.setStyleSheet("background: transparent; border: none; color: white;")
         
         title_label = QLabel(title)
-        title_label.setFont(QFont("Segoe UI", 10))
+        title_label.setFont(_FONT_BADGE_TITLE)
         title_label.setAlignment(Qt.AlignCenter)
         title_label.setWordWrap(True)
-        title_label.setStyleSheet("background: transparent; border: none; color: rgba(255,255,255,0.95);")
+        title_label.setObjectName("badgeTitle")
         
         layout.addWidget(icon_label)
         layout.addWidget(value_label)
         layout.addWidget(title_label)
+
+    def set_value(self, value):
+        """Update the displayed value without rebuilding the badge."""
+        self.value_label.setText(str(value))
     
-    def darken_color(self, color):
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def darken_color(color):
         """Darken a hex color by 10%"""
-        color = color.lstrip('#')
-        r, g, b = tuple(int(color[i:i+2], 16) for i in (0, 2, 4))
-        r, g, b = max(0, r-25), max(0, g-25), max(0, b-25)
-        return f'#{r:02x}{g:02x}{b:02x}'
+        n = int(color.lstrip('#'), 16)
+        r, g, b = max(0, (n >> 16) - 25), max(0, ((n >> 8) & 0xFF) - 25), max(0, (n & 0xFF) - 25)
+        return f'#{(r << 16) | (g << 8) | b:06x}'
 
 
 # ============================================================
 # 🎨 Confetti Animation Widget
 # ============================================================
 class ConfettiWidget(QWidget):
+    PARTICLE_COUNT = 50
+    BASE_INTERVAL = 30  # ms per tick the particle speeds were tuned for
+    DURATION = 3000  # ms
+
+    finished = pyqtSignal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.confetti = []
+        import numpy as np  # imported on first celebration, not with the page
         self.colors = ['#EF4444', '#F59E0B', '#10B981', '#3B82F6', '#8B5CF6', '#EC4899']
-        
-        for _ in range(50):
-            self.confetti.append({
-                'x': random.randint(0, 1000),
-                'y': random.randint(-500, 0),
-                'size': random.randint(6, 12),
-                'speed': random.uniform(2, 5),
-                'color': random.choice(self.colors),
-                'rotation': random.randint(0, 360)
-            })
-        
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_confetti)
+        self._brushes = [QBrush(QColor(c)) for c in self.colors]
+        
+        # Particle state as parallel arrays (structure of arrays)
+        n = self.PARTICLE_COUNT
+        self.xs = np.random.randint(0, 1001, n).astype(np.float32)
+        self.ys = np.random.randint(-500, 1, n).astype(np.float32)
+        self.sizes = np.random.randint(6, 13, n)
+        self.speeds = np.random.uniform(2, 5, n).astype(np.float32)
+        self.rotations = np.random.randint(0, 361, n).astype(np.float32)
+        self.color_idx = np.random.randint(0, len(self.colors), n)
+        
+        self._step = 1.0
+        self._frame_speeds = self.speeds
+        
+        # Timers are created on the first start()
+        self.timer = None
+        self._stop_timer = None
         self.setAttribute(Qt.WA_TransparentForMouseEvents)
         self.setStyleSheet("background: transparent;")
     
+    def _frame_interval(self):
+        """Return one display frame in ms (falls back to 60 Hz)."""
+        screen = QGuiApplication.primaryScreen()
+        refresh_rate = screen.refreshRate() if screen else 0
+        return max(1, round(1000 / refresh_rate)) if refresh_rate > 0 else 16
+    
     def start(self):
+        if self.timer is None:
+            self.timer = QTimer(self)
+            self.timer.setTimerType(Qt.PreciseTimer)
+            self.timer.timeout.connect(self.update_confetti)
+            self._stop_timer = QTimer(self)
+            self._stop_timer.setSingleShot(True)
+            self._stop_timer.timeout.connect(self.stop)
+        
+        interval = self._frame_interval()
+        # Scale per-tick motion so the fall speed doesn't depend on the refresh rate
+        self._step = interval / self.BASE_INTERVAL
+        self._frame_speeds = self.speeds * self._step
         self.show()
-        self.timer.start(30)
-        QTimer.singleShot(3000, self.stop)
+        self.timer.start(interval)
+        self._stop_timer.start(self.DURATION)
     
     def stop(self):
         self.timer.stop()
         self.hide()
+        self.finished.emit()
     
     def update_confetti(self):
-        for c in self.confetti:
-            c['y'] += c['speed']
-            c['rotation'] += 5
-            if c['y'] > self.height():
-                c['y'] = -20
-                c['x'] = random.randint(0, self.width())
+        import numpy as np
+        self.ys += self._frame_speeds
+        self.rotations += 5 * self._step
+        fallen = self.ys > self.height()
+        count = int(fallen.sum())
+        if count:
+            self.ys[fallen] = -20
+            self.xs[fallen] = np.random.randint(0, self.width() + 1, count)
         self.update()
     
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
-        
-        for c in self.confetti:
-            painter.save()
-            painter.translate(c['x'], c['y'])
-            painter.rotate(c['rotation'])
-            
-            color = QColor(c['color'])
-            painter.setBrush(QBrush(color))
-            painter.setPen(Qt.NoPen)
-            painter.drawRect(-c['size']//2, -c['size']//2, c['size'], c['size'])
-            
-            painter.restore()
+        painter.setPen(Qt.NoPen)
+        brushes = self._brushes
+        
+        for x, y, rotation, size, color in zip(
+            self.xs.tolist(), self.ys.tolist(), self.rotations.tolist(),
+            self.sizes.tolist(), self.color_idx.tolist()
+        ):
+            painter.resetTransform()
+            painter.translate(x, y)
+            painter.rotate(rotation)
+            painter.setBrush(brushes[color])
+            painter.drawRect(-size//2, -size//2, size, size)
 
 
 # ============================================================
@@ -312,30 +546,71 @@ class CompletedPage(QWidget):
         user = self.db.get_user_by_email(self.user_email)
         self.user_id = user["id"] if user else None
 
+        # Cached query results, invalidated only after a mutation
+        self._completed_cache = None
+        self._stats_cache = None
+
+        self._load_data()
         self.init_ui()
+        self._init_dialogs()
         self.load_completed_tasks()
 
+    def _load_data(self, force=False):
+        """Fetch completed tasks and the aggregated stats (cached until forced)."""
+        if not force and self._completed_cache is not None:
+            return
+        if not self.user_id:
+            self._completed_cache = []
+            self._stats_cache = {"total_tasks": 0, "completed": 0, "total_duration": 0}
+            return
+        self._completed_cache = self.db.get_completed_tasks(self.user_id)
+        self._stats_cache = self.db.get_completed_stats(self.user_id)
+
+    def _init_dialogs(self):
+        """Build the details and confirmation dialogs once and reuse them per click"""
+        self._details_msg = QMessageBox(self)
+        self._details_msg.setWindowTitle("Task Details")
+        self._details_msg.setIcon(QMessageBox.Information)
+        self._details_msg.setStyleSheet(_MSGBOX_QSS)
+
+        self._confirm_msg = QMessageBox(self)
+        self._confirm_msg.setStyleSheet(_MSGBOX_QSS)
+        self._confirm_yes = self._confirm_msg.addButton("Yes", QMessageBox.YesRole)
+        self._confirm_no = self._confirm_msg.addButton("No", QMessageBox.NoRole)
+
+    def _confirm(self, title, icon, text, informative="", yes_text="Yes",
+                 no_text="No", destructive=False):
+        """Reuse the shared confirmation dialog; returns True if accepted"""
+        msg = self._confirm_msg
+        msg.setWindowTitle(title)
+        msg.setIcon(icon)
+        msg.setText(text)
+        msg.setInformativeText(informative)
+
+        # Only re-apply stylesheets when switching between restore/delete looks
+        qss = _DELETE_MSGBOX_QSS if destructive else _MSGBOX_QSS
+        if msg.styleSheet() != qss:
+            msg.setStyleSheet(qss)
+        btn_qss = _DELETE_BTN_QSS if destructive else ""
+        if self._confirm_yes.styleSheet() != btn_qss:
+            self._confirm_yes.setStyleSheet(btn_qss)
+
+        self._confirm_yes.setText(yes_text)
+        self._confirm_no.setText(no_text)
+        msg.setDefaultButton(self._confirm_no)
+        msg.exec_()
+        return msg.clickedButton() is self._confirm_yes
+
     def init_ui(self):
         # Main layout with gradient background
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
         
         # Background gradient
-        self.setStyleSheet("""
-            QWidget {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #F0FDF4,
-                    stop:0.5 #ECFDF5,
-                    stop:1 #D1FAE5
-                );
-            }
-        """)
+        self.setStyleSheet(_PAGE_QSS)
         
-        # Confetti overlay
-        self.confetti = ConfettiWidget(self)
-        self.confetti.setGeometry(0, 0, 1200, 700)
-        self.confetti.hide()
+        # Confetti overlay (created on the first celebration)
+        self.confetti = None
         
         # Content wrapper
         content = QWidget()
@@ -349,11 +624,11 @@ class CompletedPage(QWidget):
         # Title with icon
         title_section = QVBoxLayout()
         title = QLabel("🏆 Completed Tasks")
-        title.setFont(QFont("Segoe UI", 28, QFont.Bold))
+        title.setFont(_FONT_PAGE_TITLE)
         title.setStyleSheet("color: #047857; background: transparent;")
         
         subtitle = QLabel("Your achievements and completed work")
-        subtitle.setFont(QFont("Segoe UI", 11))
+        subtitle.setFont(_FONT_SUBTITLE)
         subtitle.setStyleSheet("color: #059669; background: transparent;")
         
         title_section.addWidget(title)
@@ -365,28 +640,7 @@ class CompletedPage(QWidget):
         # Celebration button
         celebrate_btn = QPushButton("🎉 Celebrate!")
         celebrate_btn.setMinimumSize(180, 55)
-        celebrate_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #10B981,
-                    stop:1 #059669
-                );
-                color: white;
-                border: none;
-                border-radius: 12px;
-                padding: 14px 28px;
-                font-size: 13pt;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #059669,
-                    stop:1 #047857
-                );
-            }
-        """)
+        celebrate_btn.setStyleSheet(_CELEBRATE_BTN_QSS)
         celebrate_btn.clicked.connect(self.celebrate)
         
         header_layout.addWidget(celebrate_btn)
@@ -397,28 +651,20 @@ class CompletedPage(QWidget):
         stats_layout.setSpacing(20)
         
         # Get real stats with calculations
-        completed_tasks = self.db.get_completed_tasks(self.user_id) if self.user_id else []
-        all_tasks = self.db.get_all_tasks(self.user_id) if self.user_id else []
-        
-        total_completed = len(completed_tasks)
-        total_tasks = len(all_tasks)
-        total_time = sum(t["duration"] for t in completed_tasks) if completed_tasks else 0
-        
-        # Calculate success rate (completed / total tasks)
-        success_rate = int((total_completed / total_tasks * 100)) if total_tasks > 0 else 0
-        
-        # Calculate average task duration
-        avg_duration = int(total_time / total_completed) if total_completed > 0 else 0
+        stats = self._compute_stats()
         
         badges_data = [
-            ("✅", "Tasks Done", total_completed, "#10B981"),
-            ("⏱️", "Total Time", f"{total_time//60}h {total_time%60}m", "#3B82F6"),
-            ("📊", "Average Duration", f"{avg_duration} min", "#F59E0B"),
-            ("🎯", "Success Rate", f"{success_rate}%", "#8B5CF6")
+            ("done", "✅", "Tasks Done", "#10B981"),
+            ("time", "⏱️", "Total Time", "#3B82F6"),
+            ("avg", "📊", "Average Duration", "#F59E0B"),
+            ("rate", "🎯", "Success Rate", "#8B5CF6")
         ]
         
-        for icon, title, value, color in badges_data:
-            badge = AchievementBadge(icon, title, value, color)
+        # Keep references so refreshes only update the values
+        self.badge_widgets = {}
+        for key, icon, title, color in badges_data:
+            badge = AchievementBadge(icon, title, stats[key], color)
+            self.badge_widgets[key] = badge
             stats_layout.addWidget(badge)
         
         stats_layout.addStretch()
@@ -426,114 +672,118 @@ class CompletedPage(QWidget):
         
         # Tasks section header
         tasks_header = QLabel("📋 Completed Tasks List")
-        tasks_header.setFont(QFont("Segoe UI", 16, QFont.Bold))
+        tasks_header.setFont(_FONT_SECTION_TITLE)
         tasks_header.setStyleSheet("color: #1E293B; background: transparent; margin-top: 10px;")
         content_layout.addWidget(tasks_header)
         
-        # Scrollable task list
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                background: transparent;
-                border: none;
-            }
-            QScrollBar:vertical {
-                background: rgba(226, 232, 240, 0.5);
-                width: 10px;
-                border-radius: 5px;
-            }
-            QScrollBar::handle:vertical {
-                background: #10B981;
-                border-radius: 5px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #059669;
-            }
-        """)
-        
-        self.task_container = QWidget()
-        self.task_layout = QVBoxLayout(self.task_container)
-        self.task_layout.setSpacing(15)
-        self.task_layout.setContentsMargins(0, 0, 0, 0)
-        
-        scroll.setWidget(self.task_container)
-        content_layout.addWidget(scroll)
-        
+        # Completed tasks table (model/view: only visible rows are painted)
+        self.model = CompletedTasksModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setMouseTracking(True)
+        self.table.setShowGrid(False)
+        self.table.setWordWrap(True)
+        self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setDefaultSectionSize(64)
+        self.table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Stretch)
+        header.setSectionResizeMode(0, QHeaderView.Fixed)
+        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(4, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(CompletedTasksModel.ACTIONS_COLUMN, QHeaderView.Fixed)
+        self.table.setColumnWidth(0, 48)
+
+        self.actions_delegate = TaskActionsDelegate(self.table)
+        self.table.setItemDelegateForColumn(CompletedTasksModel.ACTIONS_COLUMN, self.actions_delegate)
+        self.table.setColumnWidth(
+            CompletedTasksModel.ACTIONS_COLUMN,
+            self.actions_delegate.sizeHint(None, QModelIndex()).width()
+        )
+        # Queued so handlers (which may reset the model) run after the click event returns
+        self.actions_delegate.actionTriggered.connect(self._on_task_action, Qt.QueuedConnection)
+
+        self.table.setStyleSheet(_TABLE_QSS)
+        content_layout.addWidget(self.table)
+
+        # Empty state
+        self.empty_state = QWidget()
+        empty_layout = QVBoxLayout(self.empty_state)
+        empty_layout.setAlignment(Qt.AlignCenter)
+
+        empty_icon = QLabel()
+        empty_icon.setPixmap(_emoji_pixmap("📭", 96))
+        empty_icon.setAlignment(Qt.AlignCenter)
+        empty_icon.setStyleSheet("background: transparent;")
+
+        empty_text = QLabel("No completed tasks yet")
+        empty_text.setFont(_FONT_EMPTY_TEXT)
+        empty_text.setAlignment(Qt.AlignCenter)
+        empty_text.setStyleSheet("color: #64748B; background: transparent;")
+
+        empty_subtext = QLabel("Complete tasks from the Planner to see them here!")
+        empty_subtext.setAlignment(Qt.AlignCenter)
+        empty_subtext.setStyleSheet("color: #94A3B8; background: transparent;")
+
+        empty_layout.addWidget(empty_icon)
+        empty_layout.addWidget(empty_text)
+        empty_layout.addWidget(empty_subtext)
+        self.empty_state.hide()
+        content_layout.addWidget(self.empty_state)
+
         main_layout.addWidget(content)
 
     def load_completed_tasks(self):
-        """Load and display completed tasks as beautiful cards"""
+        """Load completed tasks into the table model"""
         if not self.user_id:
             return
-        
-        # Clear existing tasks
-        while self.task_layout.count():
-            item = self.task_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        tasks = self.db.get_completed_tasks(self.user_id)
-        
-        if not tasks:
-            # Empty state
-            empty_widget = QWidget()
-            empty_layout = QVBoxLayout(empty_widget)
-            empty_layout.setAlignment(Qt.AlignCenter)
-            
-            empty_icon = QLabel("📭")
-            empty_icon.setFont(QFont("Segoe UI", 64))
-            empty_icon.setAlignment(Qt.AlignCenter)
-            empty_icon.setStyleSheet("background: transparent;")
-            
-            empty_text = QLabel("No completed tasks yet")
-            empty_text.setFont(QFont("Segoe UI", 14))
-            empty_text.setAlignment(Qt.AlignCenter)
-            empty_text.setStyleSheet("color: #64748B; background: transparent;")
-            
-            empty_subtext = QLabel("Complete tasks from the Planner to see them here!")
-            empty_subtext.setAlignment(Qt.AlignCenter)
-            empty_subtext.setStyleSheet("color: #94A3B8; background: transparent;")
-            
-            empty_layout.addWidget(empty_icon)
-            empty_layout.addWidget(empty_text)
-            empty_layout.addWidget(empty_subtext)
-            
-            self.task_layout.addWidget(empty_widget)
+
+        self.model.set_rows(self._completed_cache)
+        self._update_empty_state()
+
+    def _update_empty_state(self):
+        """Show the empty-state placeholder instead of an empty table"""
+        has_tasks = bool(self._completed_cache)
+        self.table.setVisible(has_tasks)
+        self.empty_state.setVisible(not has_tasks)
+
+    def _remove_task_locally(self, task_id, deleted):
+        """Drop a task from the caches, the model and the badge totals in place"""
+        for row, task in enumerate(self._completed_cache):
+            if task["id"] == task_id:
+                break
+        else:
             return
-        
-        # Add task cards
-        for task in tasks:
-            card = CompletedTaskCard(
-                task["id"],
-                task["title"],
-                task["deadline"],
-                task["duration"],
-                task["strategy"]
-            )
-            
-            # Connect buttons
-            card.view_btn.clicked.connect(lambda _, t=task: self.view_details(t))
-            card.restore_btn.clicked.connect(lambda _, tid=task["id"], title=task["title"]: self.restore_task(tid, title))
-            card.delete_btn.clicked.connect(lambda _, tid=task["id"], title=task["title"]: self.delete_task(tid, title))
-            
-            self.task_layout.addWidget(card)
-            
-            # Animate card appearance
-            animation = QPropertyAnimation(card, b"geometry")
-            animation.setDuration(300)
-            animation.setEasingCurve(QEasingCurve.OutCubic)
-            animation.setStartValue(QRect(0, -100, card.width(), card.height()))
-            animation.setEndValue(card.geometry())
-            animation.start()
-        
-        self.task_layout.addStretch()
+
+        self._completed_cache.pop(row)
+        self.model.remove_row(row)
+
+        self._stats_cache["completed"] -= 1
+        self._stats_cache["total_duration"] -= task["duration"] or 0
+        if deleted:
+            self._stats_cache["total_tasks"] -= 1
+
+        self._refresh_badges()
+        self._update_empty_state()
+
+    def _on_task_action(self, action, row):
+        """Dispatch a delegate button click to the matching handler"""
+        task = self.model.task_at(row)
+        if action == "view":
+            self.view_details(task)
+        elif action == "restore":
+            self.restore_task(task["id"], task["title"])
+        elif action == "delete":
+            self.delete_task(task["id"], task["title"])
 
     def view_details(self, task):
         """Show task details in a beautiful dialog"""
-        msg = QMessageBox(self)
-        msg.setWindowTitle("Task Details")
-        msg.setIcon(QMessageBox.Information)
+        msg = self._details_msg
         msg.setText(f"<h2>✅ {task['title']}</h2>")
         msg.setInformativeText(
             f"<p><b>📅 Deadline:</b> {task['deadline'] or 'No deadline'}</p>"
@@ -542,138 +792,39 @@ class CompletedPage(QWidget):
             f"<p><b>🏆 Priority:</b> P{task['priority']}</p>"
             f"<p><b>📊 Status:</b> {task['status'].upper()}</p>"
         )
-        msg.setStyleSheet("""
-            QMessageBox {
-                background-color: white;
-            }
-            QMessageBox QLabel {
-                color: #1E293B;
-                font-size: 11pt;
-            }
-            QPushButton {
-                background-color: #3B82F6;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 24px;
-                font-size: 11pt;
-                font-weight: 600;
-                min-width: 80px;
-                min-height: 36px;
-            }
-            QPushButton:hover {
-                background-color: #2563EB;
-            }
-        """)
         msg.exec_()
 
     def restore_task(self, task_id, task_title):
         """Restore task to pending"""
-        msg = QMessageBox(self)
-        msg.setWindowTitle("Restore Task")
-        msg.setIcon(QMessageBox.Question)
-        msg.setText(f"Move '{task_title}' back to Planner?")
-        msg.setStyleSheet("""
-            QMessageBox {
-                background-color: white;
-            }
-            QMessageBox QLabel {
-                color: #1E293B;
-                font-size: 11pt;
-            }
-            QPushButton {
-                background-color: #3B82F6;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 24px;
-                font-size: 11pt;
-                font-weight: 600;
-                min-width: 80px;
-                min-height: 36px;
-            }
-            QPushButton:hover {
-                background-color: #2563EB;
-            }
-        """)
-        
-        yes_btn = msg.addButton("Yes", QMessageBox.YesRole)
-        no_btn = msg.addButton("No", QMessageBox.NoRole)
-        msg.exec_()
-        
-        if msg.clickedButton() == yes_btn:
-            self.db.update_task_status(task_id, "pending")
+        if self._confirm("Restore Task", QMessageBox.Question,
+                         f"Move '{task_title}' back to Planner?"):
+            if not self.db.update_task_status(task_id, "pending"):
+                QMessageBox.warning(self, "❌ Restore Failed",
+                    f"'{task_title}' could not be restored. Please try again.")
+                return
+            self._remove_task_locally(task_id, deleted=False)
             QMessageBox.information(self, "✅ Restored", 
                 f"'{task_title}' has been moved back to Planner!")
-            self.refresh_page()
 
     def delete_task(self, task_id, task_title):
         """Permanently delete task"""
-        msg = QMessageBox(self)
-        msg.setWindowTitle("⚠️ Delete Task")
-        msg.setIcon(QMessageBox.Warning)
-        msg.setText(f"Permanently delete '{task_title}'?")
-        msg.setInformativeText("This action cannot be undone!")
-        msg.setStyleSheet("""
-            QMessageBox {
-                background-color: white;
-            }
-            QMessageBox QLabel {
-                color: #1E293B;
-                font-size: 11pt;
-            }
-            QPushButton {
-                background-color: #64748B;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 24px;
-                font-size: 11pt;
-                font-weight: 600;
-                min-width: 80px;
-                min-height: 36px;
-            }
-            QPushButton:hover {
-                background-color: #475569;
-            }
-        """)
-        
-        yes_btn = msg.addButton("Delete", QMessageBox.YesRole)
-        yes_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #EF4444;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 24px;
-                font-size: 11pt;
-                font-weight: 600;
-                min-width: 80px;
-                min-height: 36px;
-            }
-            QPushButton:hover {
-                background-color: #DC2626;
-            }
-        """)
-        no_btn = msg.addButton("Cancel", QMessageBox.NoRole)
-        msg.exec_()
-        
-        if msg.clickedButton() == yes_btn:
-            self.db.delete_task(task_id)
+        if self._confirm("⚠️ Delete Task", QMessageBox.Warning,
+                         f"Permanently delete '{task_title}'?",
+                         "This action cannot be undone!",
+                         yes_text="Delete", no_text="Cancel", destructive=True):
+            if not self.db.delete_task(task_id):
+                QMessageBox.warning(self, "❌ Delete Failed",
+                    f"'{task_title}' could not be deleted. Please try again.")
+                return
+            self._remove_task_locally(task_id, deleted=True)
             QMessageBox.information(self, "🗑️ Deleted", 
                 f"'{task_title}' has been permanently deleted.")
-            self.refresh_page()
     
-    def refresh_stats(self):
-        """Refresh only the stats cards without recreating entire UI"""
-        # Find and update stats badges
-        # Get real stats with calculations
-        completed_tasks = self.db.get_completed_tasks(self.user_id) if self.user_id else []
-        all_tasks = self.db.get_all_tasks(self.user_id) if self.user_id else []
-        
-        total_completed = len(completed_tasks)
-        total_tasks = len(all_tasks)
-        total_time = sum(t["duration"] for t in completed_tasks) if completed_tasks else 0
+    def _compute_stats(self):
+        """Return the formatted badge values from the cached SQL aggregates"""
+        total_completed = self._stats_cache["completed"]
+        total_tasks = self._stats_cache["total_tasks"]
+        total_time = self._stats_cache["total_duration"]
         
         # Calculate success rate (completed / total tasks)
         success_rate = int((total_completed / total_tasks * 100)) if total_tasks > 0 else 0
@@ -681,21 +832,43 @@ class CompletedPage(QWidget):
         # Calculate average task duration
         avg_duration = int(total_time / total_completed) if total_completed > 0 else 0
         
-        # Update would require recreating badges, so let's just reload tasks
-        self.load_completed_tasks()
+        return {
+            "done": total_completed,
+            "time": f"{total_time//60}h {total_time%60}m",
+            "avg": f"{avg_duration} min",
+            "rate": f"{success_rate}%",
+        }
+    
+    def _refresh_badges(self):
+        """Write the current stats into the existing badge widgets"""
+        stats = self._compute_stats()
+        for key, badge in self.badge_widgets.items():
+            badge.set_value(stats[key])
+    
+    def refresh_stats(self):
+        """Refresh only the stats cards without recreating entire UI"""
+        self._load_data(force=True)
+        self._refresh_badges()
     
     def refresh_page(self):
-        """Refresh entire page with updated stats"""
-        # Clear and reload everything
-        self.load_completed_tasks()
-        # Recreate the whole UI to update stats cards
-        # Clear current layout
-        QWidget().setLayout(self.layout())
-        self.init_ui()
+        """Refresh stats cards and task table in place with updated data"""
+        self._load_data(force=True)
+        self._refresh_badges()
         self.load_completed_tasks()
 
     def celebrate(self):
         """Trigger celebration animation"""
+        if self.confetti is None:
+            self.confetti = ConfettiWidget(self)
+            self.confetti.finished.connect(self._release_confetti)
+        self.confetti.setGeometry(self.rect())
+        self.confetti.raise_()
         self.confetti.start()
         QMessageBox.information(self, "🎉 Awesome!", 
-            "You're doing great! Keep up the excellent work! 🌟")
\ No newline at end of file
+            "You're doing great! Keep up the excellent work! 🌟")
+
+    def _release_confetti(self):
+        """Free the confetti overlay once its animation has finished"""
+        if self.confetti is not None:
+            self.confetti.deleteLater()
+            self.confetti = None
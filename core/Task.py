@@ -22,6 +22,12 @@ Created:
 from datetime import datetime
 
 class Task:
+    # Fixed attribute layout: no per-instance __dict__ for the many Task objects loaded from the DB
+    __slots__ = (
+        "__taskid", "__priority", "__title", "__deadline", "__duration", "__status",
+        "__status_listeners", "__schedule_listeners",
+    )
+
     def __init__(self, taskid: int, priority: int, title: str, deadline: datetime, duration: int, status: str = "pending"):
         self.__taskid = taskid
         self.__priority = priority
@@ -29,6 +35,8 @@ class Task:
         self.__deadline = deadline
         self.__duration = duration
         self.__status = status
+        self.__status_listeners = []  # callables(task, old, new) run on status changes
+        self.__schedule_listeners = []  # callables(task) run on deadline/priority changes
 
     # ----- Getters & Setters -----
     def get_taskid(self) -> int:
@@ -46,6 +54,7 @@ class Task:
     def set_priority(self, new_priority: int) -> None:
         """Update the priority of the task."""
         self.__priority = new_priority
+        self.__notify_schedule_change()
 
     def get_title(self) -> str:
         """Return the title of the task."""
@@ -62,6 +71,7 @@ class Task:
     def set_deadline(self, new_deadline: datetime) -> None:
         """Update the task deadline."""
         self.__deadline = new_deadline
+        self.__notify_schedule_change()
 
     def get_duration(self) -> int:
         """Return the duration of the task in minutes."""
@@ -78,10 +88,38 @@ class Task:
     def set_status(self, new_status: str) -> None:
         """Update the status of the task (pending/done)."""
         if new_status in ["pending", "done"]:
+            old_status = self.__status
             self.__status = new_status
+            if old_status != new_status:
+                for listener in list(self.__status_listeners):
+                    listener(self, old_status, new_status)
         else:
             raise ValueError("Status must be either 'pending' or 'done'")
 
+    def add_status_listener(self, listener) -> None:
+        """Register a callable(task, old, new) invoked when the status changes."""
+        if listener not in self.__status_listeners:
+            self.__status_listeners.append(listener)
+
+    def remove_status_listener(self, listener) -> None:
+        """Unregister a previously added status listener."""
+        if listener in self.__status_listeners:
+            self.__status_listeners.remove(listener)
+
+    def add_schedule_listener(self, listener) -> None:
+        """Register a callable(task) invoked when the deadline or priority changes."""
+        if listener not in self.__schedule_listeners:
+            self.__schedule_listeners.append(listener)
+
+    def remove_schedule_listener(self, listener) -> None:
+        """Unregister a previously added schedule listener."""
+        if listener in self.__schedule_listeners:
+            self.__schedule_listeners.remove(listener)
+
+    def __notify_schedule_change(self) -> None:
+        for listener in list(self.__schedule_listeners):
+            listener(self)
+
     # ----- Business Logic -----
     def mark_done(self) -> None:
         """Mark the task as completed."""
@@ -14,12 +14,25 @@ Created:
     2025-10-04
 """
 
+from bisect import insort
+from collections import defaultdict
 from datetime import datetime
 from core.task import Task
 from core.user import User
 from strategies.strategy_base import StudyStrategy
 
 
+# None is not comparable, so tasks without a deadline/priority sort after all others
+def _deadline_key(task: Task) -> tuple:
+    deadline = task.get_deadline()
+    return (deadline is None, deadline or datetime.max)
+
+
+def _priority_key(task: Task) -> tuple:
+    priority = task.get_priority()
+    return (priority is None, priority or 0)
+
+
 class Planner:
     """
     Class representing the central planner of the Smart Study Planner system.
@@ -35,6 +48,16 @@ class Planner:
         List of Task objects managed by the planner.
     __strategy : StudyStrategy
         Injected strategy defining the study behavior (e.g., Pomodoro, DeepWork).
+    __task_set : set[Task]
+        Set mirror of the task list for O(1) membership checks.
+    __by_status : defaultdict[str, list[Task]]
+        Tasks bucketed by status, kept in sync with the task list.
+    __by_deadline, __by_priority : list[Task]
+        The same tasks kept sorted by deadline and by priority.
+    __db : DatabaseManager, optional
+        Database handle; when set together with a user ID, stats are counted in SQL.
+    __user_id : int, optional
+        Database ID of the user whose tasks this planner mirrors.
 
     Methods
     -------
@@ -50,6 +73,10 @@ class Planner:
         Removes a task.
     show_stats() -> dict[str, int]
         Returns 'done' vs 'pending' statistics.
+    notify_status_change(task: Task, old: str, new: str) -> None
+        Moves a task to its new status bucket.
+    notify_schedule_change(task: Task) -> None
+        Re-sorts a task whose deadline or priority changed.
     filter_tasks(by_status: str) -> list[Task]
         Filters tasks by status.
     sort_tasks(by_deadline: bool = True) -> list[Task]
@@ -58,7 +85,8 @@ class Planner:
         Executes the injected study strategy.
     """
 
-    def __init__(self, user: User, strategy: StudyStrategy, tasks: list[Task] = None):
+    def __init__(self, user: User, strategy: StudyStrategy, tasks: list[Task] = None,
+                 db=None, user_id: int = None):
         """
         Initialize the Planner instance.
 
@@ -70,10 +98,25 @@ class Planner:
             The injected productivity strategy (Dependency Injection).
         tasks : list[Task], optional
             Initial list of tasks (default is an empty list).
+        db : DatabaseManager, optional
+            Database handle used to compute stats in SQL.
+        user_id : int, optional
+            Database ID of the user; required together with `db`.
         """
         self.__user = user
         self.__tasks: list[Task] = [] if tasks is None else tasks
         self.__strategy = strategy
+        self.__db = db
+        self.__user_id = user_id
+
+        # Status buckets and sorted views are built once here, then updated incrementally
+        self.__task_set: set[Task] = set(self.__tasks)
+        self.__by_status: defaultdict[str, list[Task]] = defaultdict(list)
+        self.__by_deadline: list[Task] = sorted(self.__tasks, key=_deadline_key)
+        self.__by_priority: list[Task] = sorted(self.__tasks, key=_priority_key)
+        for task in self.__tasks:
+            self.__by_status[task.get_status()].append(task)
+            self.__listen(task)
 
     # ----- Getters & Setters -----
     def get_user(self) -> User:
@@ -100,29 +143,65 @@ class Planner:
     def add_task(self, task: Task) -> None:
         """Add a task to the planner."""
         self.__tasks.append(task)
+        self.__task_set.add(task)
+        self.__track(task)
 
     def remove_task(self, task: Task) -> None:
         """Remove a task from the planner."""
-        if task in self.__tasks:
+        if task in self.__task_set:
+            self.__task_set.discard(task)
             self.__tasks.remove(task)
+            self.__untrack(task)
+
+    def __listen(self, task: Task) -> None:
+        task.add_status_listener(self.notify_status_change)
+        task.add_schedule_listener(self.notify_schedule_change)
+
+    def __track(self, task: Task) -> None:
+        """Index a task by status and sort keys, and listen for later changes."""
+        self.__by_status[task.get_status()].append(task)
+        insort(self.__by_deadline, task, key=_deadline_key)
+        insort(self.__by_priority, task, key=_priority_key)
+        self.__listen(task)
+
+    def __untrack(self, task: Task) -> None:
+        """Drop a task that left the planner from every index."""
+        self.__by_status[task.get_status()].remove(task)
+        self.__by_deadline.remove(task)
+        self.__by_priority.remove(task)
+        task.remove_status_listener(self.notify_status_change)
+        task.remove_schedule_listener(self.notify_schedule_change)
+
+    def notify_status_change(self, task: Task, old: str, new: str) -> None:
+        """Move one task between the status buckets."""
+        self.__by_status[old].remove(task)
+        self.__by_status[new].append(task)
+
+    def notify_schedule_change(self, task: Task) -> None:
+        """Re-insert a task whose deadline or priority changed into the sorted views."""
+        self.__by_deadline.remove(task)
+        insort(self.__by_deadline, task, key=_deadline_key)
+        self.__by_priority.remove(task)
+        insort(self.__by_priority, task, key=_priority_key)
 
     # ----- Business Logic -----
     def show_stats(self) -> dict[str, int]:
         """Return statistics about tasks (done vs pending)."""
-        done = sum(1 for t in self.__tasks if t.get_status() == "done")
-        pending = sum(1 for t in self.__tasks if t.get_status() == "pending")
-        return {"done": done, "pending": pending}
+        if self.__db is not None and self.__user_id is not None:
+            counts = self.__db.get_status_counts(self.__user_id)
+            return {"done": counts.get("done", 0), "pending": counts.get("pending", 0)}
+        return {"done": len(self.__by_status["done"]), "pending": len(self.__by_status["pending"])}
 
     def filter_tasks(self, by_status: str) -> list[Task]:
         """Filter tasks by a given status."""
-        return [t for t in self.__tasks if t.get_status() == by_status]
+        return list(self.__by_status.get(by_status, ()))
 
     def sort_tasks(self, by_deadline: bool = True) -> list[Task]:
         """Sort tasks by deadline (default) or priority."""
         if by_deadline:
-            return sorted(self.__tasks, key=lambda t: t.get_deadline())
+            return list(self.__by_deadline)
         else:
-            return sorted(self.__tasks, key=lambda t: t.get_priority())
+            return list(self.__by_priority)
 
     # ----- Strategy Execution -----
     def execute_strategy(self) -> None:
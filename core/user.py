@@ -35,6 +35,8 @@ class User:
         self.__username = username
         self.__email = email
         self.__tasks: list[Task] = []   # aggregation: User sahip ama Task bağımsız yaşayabilir
+        self.__task_set: set[Task] = set()   # O(1) üyelik kontrolü için
+        self.__tasks_view: tuple[Task, ...] | None = None   # view_tasks önbelleği, değişiklikte sıfırlanır
 
     # ----- Getters & Setters -----
     def get_username(self) -> str:
@@ -61,12 +63,19 @@ class User:
     def add_task(self, new_task: Task) -> None:
         """Add a new task to the user's task list."""
         self.__tasks.append(new_task)
+        self.__task_set.add(new_task)
+        self.__tasks_view = None
 
     def remove_task(self, task: Task) -> None:
         """Remove a task from the user's task list."""
-        if task in self.__tasks:
+        if task in self.__task_set:
+            self.__task_set.discard(task)
             self.__tasks.remove(task)
-
-    def view_tasks(self) -> list[Task]:
-        """Return a copy of the user's tasks."""
-        return list(self.__tasks)   # encapsulation: dışarıya kopya veriyoruz
+            self.__tasks_view = None
+
+    def view_tasks(self) -> tuple[Task, ...]:
+        """Return a read-only snapshot of the user's tasks."""
+        if self.__tasks_view is None:
+            # encapsulation: dışarıya değiştirilemez tuple veriyoruz, liste değişene kadar tekrar kopyalanmaz
+            self.__tasks_view = tuple(self.__tasks)
+        return self.__tasks_view
@@ -7,7 +7,8 @@ SQLite tabanlı veritabanı yöneticisi.
 Bu modül, Smart Study Planner uygulamasındaki tüm verilerin kalıcı olarak 
 saklanmasını sağlar. Aşağıdaki ana tabloları içerir:
 
-- users: Kullanıcı bilgileri, streak, toplam odak süresi, başarımlar
+- users: Kullanıcı bilgileri, streak, toplam odak süresi
+- achievements: Kullanıcı başarımları (kullanıcı başına her başarı bir satır)
 - tasks: Kullanıcının görevleri
 - sessions: Odak oturum geçmişleri
 - user_stats: Kullanıcıya özel istatistik kayıtları (haftalık skor, streak, vb.)
@@ -16,32 +17,371 @@ saklanmasını sağlar. Aşağıdaki ana tabloları içerir:
 Tüm fonksiyonlar context manager yapısı (with get_connection()) ile güvenli çalışır.
 """
 
+import atexit
+import queue
 import sqlite3
+import threading
+import time
 from datetime import datetime
 from contextlib import contextmanager
+from functools import lru_cache
+from typing import NamedTuple
 
 # ============================================================
 # 🔹 Database Path
 # ============================================================
 DB_NAME = "study_planner.db"
 
+# Thread başına tek, uzun ömürlü bağlantı ve açık get_connection() blok derinliği
+_local = threading.local()
+
+# Her yazma işleminde artar; önbellekli okumalar bu sürümle anahtarlanır
+_write_version = 0
+
+# Oturumdaki aktif kullanıcının satırı (tüm DatabaseManager örnekleri paylaşır).
+# Kendi yazmalarımız RETURNING ile döndürdüğü sütunları commit sonrası buraya işler.
+_current_user = None
+
+# Şema süreç başına bir kez kurulur; sonraki DatabaseManager örnekleri yalnızca bağlantıyı kullanır
+_schema_lock = threading.Lock()
+_schema_ready = False
+
+
+def _open_connection():
+    """Thread'e ait bağlantıyı açar ve PRAGMA ayarlarını bir kez uygular."""
+    # isolation_level=None: BEGIN/COMMIT/SAVEPOINT get_connection() tarafından yönetilir
+    conn = sqlite3.connect(DB_NAME, isolation_level=None, cached_statements=256)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")      # dosyada kalıcıdır, okuyucular yazarı beklemez
+    conn.execute("PRAGMA synchronous=NORMAL")    # WAL modunda her commit'te fsync yapılmaz
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")     # ~20 MB sayfa önbelleği
+    conn.execute("PRAGMA mmap_size=268435456")   # 256 MB'a kadar okumalar read() yerine bellek eşlemesiyle
+    conn.execute("PRAGMA busy_timeout=5000")     # kilitliyse hemen hata vermek yerine 5 sn bekle
+    if threading.current_thread() is threading.main_thread():
+        atexit.register(conn.close)
+    return conn
+
+
+def _thread_connection():
+    """Bu thread'in bağlantısını döndürür; ilk çağrıda açar."""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = _local.conn = _open_connection()
+    return conn
+
+
+# ============================================================
+# 🔹 Schema (tek executescript çağrısında çalıştırılır)
+# ============================================================
+_SCHEMA_SQL = """
+BEGIN;
+
+-- 🔸 USERS TABLOSU
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username TEXT NOT NULL,
+    email TEXT UNIQUE NOT NULL,
+    streak_days INTEGER DEFAULT 0,
+    total_focus_minutes INTEGER DEFAULT 0,
+    tasks_completed INTEGER DEFAULT 0,
+    weekly_productivity_score REAL DEFAULT 0.0,
+    last_active_date TEXT,
+    achievements TEXT DEFAULT ''
+);
+
+-- 🔸 TASKS TABLOSU
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    priority INTEGER,
+    deadline TEXT,
+    duration INTEGER,
+    status TEXT DEFAULT 'pending',
+    strategy TEXT,
+    FOREIGN KEY (user_id) REFERENCES users(id)
+);
+
+-- 🔸 SESSIONS TABLOSU
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    task_id INTEGER,
+    strategy TEXT,
+    start_time TEXT,
+    end_time TEXT,
+    duration INTEGER,
+    FOREIGN KEY (task_id) REFERENCES tasks(id)
+);
+
+-- 🔸 USER_STATS TABLOSU
+CREATE TABLE IF NOT EXISTS user_stats (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER UNIQUE,
+    total_focus_hours REAL DEFAULT 0,
+    average_session REAL DEFAULT 0,
+    best_day TEXT DEFAULT 'N/A',
+    streak INTEGER DEFAULT 0,
+    weekly_score INTEGER DEFAULT 0,
+    FOREIGN KEY (user_id) REFERENCES users(id)
+);
+
+-- 🔸 WEEKLY_FOCUS TABLOSU
+CREATE TABLE IF NOT EXISTS weekly_focus (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER,
+    day TEXT,
+    focus_minutes INTEGER DEFAULT 0,
+    FOREIGN KEY (user_id) REFERENCES users(id)
+);
+
+-- 🔸 STRATEGY_USAGE TABLOSU
+CREATE TABLE IF NOT EXISTS strategy_usage (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER,
+    strategy TEXT,
+    usage_percent REAL,
+    FOREIGN KEY (user_id) REFERENCES users(id)
+);
+
+-- 🔸 DAILY_FOCUS TABLOSU
+CREATE TABLE IF NOT EXISTS daily_focus (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER,
+    date TEXT,
+    focus_minutes INTEGER DEFAULT 0,
+    UNIQUE(user_id, date),
+    FOREIGN KEY (user_id) REFERENCES users(id)
+);
+
+-- 🔸 ACHIEVEMENTS TABLOSU (kullanıcı başına her başarı tek satır)
+CREATE TABLE IF NOT EXISTS achievements (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    UNIQUE(user_id, name),
+    FOREIGN KEY (user_id) REFERENCES users(id)
+);
+
+-- 🔸 MIGRATION: users.achievements içindeki virgüllü listeyi satırlara taşı
+WITH RECURSIVE split(user_id, name, rest) AS (
+    SELECT id, '', achievements || ',' FROM users WHERE achievements <> ''
+    UNION ALL
+    SELECT user_id,
+           substr(rest, 1, instr(rest, ',') - 1),
+           substr(rest, instr(rest, ',') + 1)
+    FROM split
+    WHERE rest <> ''
+)
+INSERT OR IGNORE INTO achievements (user_id, name)
+SELECT user_id, name FROM split WHERE name <> '';
+UPDATE users SET achievements = '' WHERE achievements <> '';
+
+-- 🔸 TRIGGERLAR
+-- users.total_focus_minutes değişince user_stats.total_focus_hours aynı farkla güncellenir
+CREATE TRIGGER IF NOT EXISTS trg_users_focus_hours
+AFTER UPDATE OF total_focus_minutes ON users
+BEGIN
+    UPDATE user_stats
+    SET total_focus_hours = total_focus_hours
+        + (NEW.total_focus_minutes - OLD.total_focus_minutes) / 60.0
+    WHERE user_id = NEW.id;
+END;
+
+-- users.streak_days değişince user_stats.streak aynı değere çekilir
+CREATE TRIGGER IF NOT EXISTS trg_users_streak
+AFTER UPDATE OF streak_days ON users
+BEGIN
+    UPDATE user_stats SET streak = NEW.streak_days WHERE user_id = NEW.id;
+END;
+
+-- 🔸 INDEXLER
+-- (user_id, status, deadline DESC): get_completed_tasks sıralamasız okur;
+-- user_id öneki get_all_tasks ve get_completed_stats için de kullanılır.
+-- (user_id, status, priority): get_pending_tasks'in ORDER BY priority, id LIMIT'ini
+-- sıralamadan karşılar (id, index'in örtük son sütunu), ilk `limit` satırda durur.
+-- daily_focus(user_id, date) ve achievements(user_id, name) UNIQUE kısıtları zaten index oluşturur.
+DROP INDEX IF EXISTS idx_tasks_user_status;
+CREATE INDEX IF NOT EXISTS idx_tasks_user_status_deadline ON tasks(user_id, status, deadline DESC);
+CREATE INDEX IF NOT EXISTS idx_tasks_user_status_priority ON tasks(user_id, status, priority);
+CREATE INDEX IF NOT EXISTS idx_sessions_task ON sessions(task_id);
+CREATE INDEX IF NOT EXISTS idx_weekly_focus_user ON weekly_focus(user_id);
+CREATE INDEX IF NOT EXISTS idx_daily_focus_user_minutes ON daily_focus(user_id, focus_minutes DESC);
+CREATE INDEX IF NOT EXISTS idx_strategy_usage_user ON strategy_usage(user_id);
+
+COMMIT;
+"""
+
+
+# ============================================================
+# 🔹 Sık kullanılan SQL (aynı metin her çağrıda sqlite3 statement cache'ine düşer)
+# ============================================================
+_SQL_GET_USER_BY_EMAIL = "SELECT * FROM users WHERE email = ?"
+
+_SQL_GET_TASK_BY_ID = "SELECT * FROM tasks WHERE id = ?"
+
+_SQL_GET_ALL_TASKS = "SELECT * FROM tasks WHERE user_id = ?"
+
+# idx_tasks_user_status_priority hem filtreyi hem sıralamayı karşılar
+_SQL_GET_PENDING_TASKS = """
+    SELECT id, priority, title, deadline, duration, status
+    FROM tasks
+    WHERE user_id = ? AND status = 'pending'
+    ORDER BY priority, id
+    LIMIT ?
+"""
+
+# Son N günün serisi: günler özyinelemeli CTE ile üretilir, kaydı olmayan gün 0 döner
+_SQL_DAILY_FOCUS_SERIES = """
+    WITH RECURSIVE days(date) AS (
+        SELECT :first_day
+        UNION ALL
+        SELECT date(date, '+1 day') FROM days
+        LIMIT :days
+    )
+    SELECT days.date, COALESCE(f.focus_minutes, 0) AS focus_minutes
+    FROM days
+    LEFT JOIN daily_focus f ON f.user_id = :user_id AND f.date = days.date
+    ORDER BY days.date
+"""
+
+_SQL_ADD_TASK = """
+    INSERT INTO tasks (user_id, title, priority, deadline, duration, status, strategy)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_LOG_SESSION = """
+    INSERT INTO sessions (task_id, strategy, start_time, end_time, duration)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_SQL_UPSERT_DAILY_FOCUS = """
+    INSERT INTO daily_focus (user_id, date, focus_minutes)
+    VALUES (?, ?, ?)
+    ON CONFLICT(user_id, date) DO UPDATE SET
+        focus_minutes = focus_minutes + excluded.focus_minutes
+"""
+
+_SQL_ADD_FOCUS_MINUTES = """
+    UPDATE users
+    SET total_focus_minutes = total_focus_minutes + ?
+    WHERE id = ?
+    RETURNING total_focus_minutes
+"""
+
+# Gün farkı SQLite'ta hesaplanır; user_stats.streak trg_users_streak ile eşitlenir.
+# 1 gün → +1, 1 günden fazla veya okunamayan tarih → 1, aynı gün → değişmez
+_SQL_UPDATE_STREAK = """
+    UPDATE users
+    SET streak_days = CASE
+            WHEN last_active_date IS NULL OR last_active_date = '' THEN 1
+            WHEN julianday(:new_date) IS NULL
+                 OR julianday(last_active_date) IS NULL THEN 1
+            WHEN CAST(julianday(:new_date) - julianday(last_active_date) AS INTEGER) = 1
+                THEN streak_days + 1
+            WHEN CAST(julianday(:new_date) - julianday(last_active_date) AS INTEGER) > 1
+                THEN 1
+            ELSE streak_days
+        END,
+        last_active_date = :new_date
+    WHERE id = :user_id
+    RETURNING streak_days, last_active_date
+"""
+
+# Ortalama, sessions(task_id) indexi üzerinden JOIN ile tek UPDATE içinde hesaplanır
+_SQL_UPDATE_AVERAGE_SESSION = """
+    UPDATE user_stats
+    SET average_session = (
+        SELECT COALESCE(AVG(s.duration), 0)
+        FROM sessions s
+        JOIN tasks t ON s.task_id = t.id
+        WHERE t.user_id = ?
+    )
+    WHERE user_id = ?
+    RETURNING average_session
+"""
+
 
 # ============================================================
 # 🔹 Safe Connection Manager
 # ============================================================
 @contextmanager
-def get_connection():
-    """Veritabanına güvenli bağlantı (otomatik commit/rollback)."""
-    conn = sqlite3.connect(DB_NAME)
-    conn.row_factory = sqlite3.Row
+def get_connection(immediate=False):
+    """Veritabanına güvenli bağlantı (otomatik commit/rollback).
+
+    En dıştaki blok bir transaction açar; iç içe bloklar SAVEPOINT kullanır,
+    böylece dış blok hepsini tek commit ile yazar. immediate=True yazma
+    kilidini transaction başında alır (BEGIN IMMEDIATE).
+    """
+    global _write_version
+    conn = _thread_connection()
+    depth = getattr(_local, "depth", 0)
+    changes = conn.total_changes
+
+    if depth:
+        savepoint = f"sp_{depth}"
+        conn.execute(f"SAVEPOINT {savepoint}")
+        _local.depth = depth + 1
+        mark = len(_local.user_updates)
+        try:
+            yield conn
+            conn.execute(f"RELEASE {savepoint}")
+        except Exception:
+            # Hata dış bloğa iletilir; orada tüm transaction geri alınır
+            conn.execute(f"ROLLBACK TO {savepoint}")
+            conn.execute(f"RELEASE {savepoint}")
+            del _local.user_updates[mark:]
+            raise
+        finally:
+            _local.depth = depth
+            if conn.total_changes != changes:
+                _write_version += 1
+        return
+
+    conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+    _local.depth = 1
+    _local.user_updates = []
     try:
         yield conn
-        conn.commit()
+        # Blok içinde conn.commit() çağrıldıysa transaction zaten kapanmıştır
+        if conn.in_transaction:
+            conn.execute("COMMIT")
+        # Aktif kullanıcı önbelleği yalnızca kalıcı olan yazmalarla güncellenir
+        for user_id, values in _local.user_updates:
+            if _current_user is not None and _current_user["id"] == user_id:
+                _current_user.update(values)
     except Exception as e:
         print(f"❌ Database error: {e}")
-        conn.rollback()
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
     finally:
-        conn.close()
+        _local.depth = 0
+        _local.user_updates = []
+        if conn.total_changes != changes:
+            _write_version += 1
+
+
+def _note_user_update(user_id, row):
+    """RETURNING ile dönen users sütunlarını, transaction commit olunca aktif kullanıcıya işlenmek üzere kaydeder."""
+    if row is not None and _current_user is not None and _current_user["id"] == user_id:
+        _local.user_updates.append((user_id, dict(row)))
+
+
+# ============================================================
+# 🔹 Cached Lookups (yazma sürümü değişince kendiliğinden geçersizleşir)
+# ============================================================
+@lru_cache(maxsize=512)
+def _user_by_email_cached(email, version):
+    with get_connection() as conn:
+        row = conn.execute(_SQL_GET_USER_BY_EMAIL, (email,)).fetchone()
+        return dict(row) if row else None
+
+
+@lru_cache(maxsize=1024)
+def _task_by_id_cached(task_id, version):
+    with get_connection() as conn:
+        row = conn.execute(_SQL_GET_TASK_BY_ID, (task_id,)).fetchone()
+        return dict(row) if row else None
 
 
 # ============================================================
@@ -51,108 +391,35 @@ class DatabaseManager:
     """Smart Study Planner için tüm CRUD işlemlerini yöneten ana sınıf."""
 
     def __init__(self):
-        self.initialize_database()
+        with _schema_lock:
+            if not _schema_ready:
+                self.initialize_database()
+
+    @contextmanager
+    def transaction(self, immediate=False):
+        """Blok içindeki tüm işlemleri tek transaction ve tek commit ile çalıştırır."""
+        with get_connection(immediate) as conn:
+            yield conn
 
     # ------------------------------------------------------------
     # 🧱 TABLE CREATION
     # ------------------------------------------------------------
     def initialize_database(self):
-        """Tüm tabloları oluşturur (varsa atlar)."""
-        with get_connection() as conn:
-            c = conn.cursor()
-
-            # 🔸 USERS TABLOSU
-            c.execute("""
-                CREATE TABLE IF NOT EXISTS users (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    username TEXT NOT NULL,
-                    email TEXT UNIQUE NOT NULL,
-                    streak_days INTEGER DEFAULT 0,
-                    total_focus_minutes INTEGER DEFAULT 0,
-                    tasks_completed INTEGER DEFAULT 0,
-                    weekly_productivity_score REAL DEFAULT 0.0,
-                    last_active_date TEXT,
-                    achievements TEXT DEFAULT ''
-                )
-            """)
-
-            # 🔸 TASKS TABLOSU
-            c.execute("""
-                CREATE TABLE IF NOT EXISTS tasks (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id INTEGER NOT NULL,
-                    title TEXT NOT NULL,
-                    priority INTEGER,
-                    deadline TEXT,
-                    duration INTEGER,
-                    status TEXT DEFAULT 'pending',
-                    strategy TEXT,
-                    FOREIGN KEY (user_id) REFERENCES users(id)
-                )
-            """)
-
-            # 🔸 SESSIONS TABLOSU
-            c.execute("""
-                CREATE TABLE IF NOT EXISTS sessions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    task_id INTEGER,
-                    strategy TEXT,
-                    start_time TEXT,
-                    end_time TEXT,
-                    duration INTEGER,
-                    FOREIGN KEY (task_id) REFERENCES tasks(id)
-                )
-            """)
-
-            # 🔸 USER_STATS TABLOSU
-            c.execute("""
-                CREATE TABLE IF NOT EXISTS user_stats (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id INTEGER UNIQUE,
-                    total_focus_hours REAL DEFAULT 0,
-                    average_session REAL DEFAULT 0,
-                    best_day TEXT DEFAULT 'N/A',
-                    streak INTEGER DEFAULT 0,
-                    weekly_score INTEGER DEFAULT 0,
-                    FOREIGN KEY (user_id) REFERENCES users(id)
-                )
-            """)
-
-            # 🔸 WEEKLY_FOCUS TABLOSU
-            c.execute("""
-                CREATE TABLE IF NOT EXISTS weekly_focus (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id INTEGER,
-                    day TEXT,
-                    focus_minutes INTEGER DEFAULT 0,
-                    FOREIGN KEY (user_id) REFERENCES users(id)
-                )
-            """)
-
-            # 🔸 STRATEGY_USAGE TABLOSU
-            c.execute("""
-                CREATE TABLE IF NOT EXISTS strategy_usage (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id INTEGER,
-                    strategy TEXT,
-                    usage_percent REAL,
-                    FOREIGN KEY (user_id) REFERENCES users(id)
-                )
-            """)
-            
-            # 🔸 DAILY_FOCUS TABLOSU
-            c.execute("""
-                CREATE TABLE IF NOT EXISTS daily_focus (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id INTEGER,
-                    date TEXT,
-                    focus_minutes INTEGER DEFAULT 0,
-                    UNIQUE(user_id, date),
-                    FOREIGN KEY (user_id) REFERENCES users(id)
-                )
-            """)
-
+        """Tüm tabloları ve indexleri oluşturur (varsa atlar)."""
+        # executescript kendi transaction'ını yönettiği için get_connection() dışında çalışır
+        global _write_version, _schema_ready
+        conn = _thread_connection()
+        changes = conn.total_changes
+        try:
+            conn.executescript(_SCHEMA_SQL)
+            _schema_ready = True
             print("✅ Database initialized successfully.")
+        except sqlite3.Error as e:
+            print(f"❌ Database error: {e}")
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+        if conn.total_changes != changes:
+            _write_version += 1   # migration kullanıcı satırlarını değiştirmiş olabilir
 
     # ------------------------------------------------------------
     # 👤 USER OPERATIONS
@@ -161,21 +428,38 @@ class DatabaseManager:
         """Yeni kullanıcı ekler (email varsa var olanı döner)."""
         with get_connection() as conn:
             c = conn.cursor()
-            c.execute("SELECT id FROM users WHERE email = ?", (email,))
-            user = c.fetchone()
-            if user:
-                return user["id"]
-            c.execute("INSERT INTO users (username, email) VALUES (?, ?)", (username, email))
-            user_id = c.lastrowid
-            c.execute("INSERT INTO user_stats (user_id) VALUES (?)", (user_id,))
-            return user_id
+            # Tek UPSERT: email boştaysa ekler ve id döner, varsa hiçbir şey yazmaz
+            c.execute("""
+                INSERT INTO users (username, email) VALUES (?, ?)
+                ON CONFLICT(email) DO NOTHING
+                RETURNING id
+            """, (username, email))
+            row = c.fetchone()
+            if row is None:
+                c.execute("SELECT id FROM users WHERE email = ?", (email,))
+                return c.fetchone()["id"]
+            c.execute("INSERT OR IGNORE INTO user_stats (user_id) VALUES (?)", (row["id"],))
+            return row["id"]
+
+    @property
+    def current_user(self):
+        """Oturumdaki aktif kullanıcı satırı; set_current_user ile bir kez yüklenir.
+
+        total_focus_minutes, streak_days ve last_active_date kendi yazmalarımızla
+        commit sonrası yerinde güncellenir; diğer sütunlar yükleme anındaki değerdir.
+        """
+        return _current_user
+
+    def set_current_user(self, email: str):
+        """Aktif kullanıcıyı email ile yükler (kayıt yoksa None) ve döndürür."""
+        global _current_user
+        _current_user = self.get_user_by_email(email)
+        return _current_user
 
     def get_user_by_email(self, email: str):
-        """Email'e göre kullanıcıyı döndürür."""
-        with get_connection() as conn:
-            c = conn.cursor()
-            c.execute("SELECT * FROM users WHERE email = ?", (email,))
-            return c.fetchone()
+        """Email'e göre kullanıcıyı döndürür (son yazmaya kadar önbellekten)."""
+        user = _user_by_email_cached(email, _write_version)
+        return dict(user) if user else None   # önbellekteki kaydı çağıran değiştiremesin
 
     # ------------------------------------------------------------
     # 🔹 USER STATISTICS & STREAKS
@@ -184,31 +468,8 @@ class DatabaseManager:
         """Kullanıcının günlük streak'ini kontrol eder ve günceller."""
         with get_connection() as conn:
             c = conn.cursor()
-            c.execute("SELECT last_active_date, streak_days FROM users WHERE id = ?", (user_id,))
-            row = c.fetchone()
-            if not row:
-                return
-            last_date = row["last_active_date"]
-            streak = row["streak_days"]
-            if last_date:
-                try:
-                    diff = (datetime.fromisoformat(new_date) - datetime.fromisoformat(last_date)).days
-                    if diff == 1:
-                        streak += 1
-                    elif diff > 1:
-                        streak = 1
-                except ValueError:
-                    streak = 1
-            else:
-                streak = 1
-            c.execute("""
-                UPDATE users
-                SET streak_days = ?, last_active_date = ?
-                WHERE id = ?
-            """, (streak, new_date, user_id))
-            c.execute("UPDATE user_stats SET streak=? WHERE user_id=?", (streak, user_id))
-
-    
+            c.execute(_SQL_UPDATE_STREAK, {"new_date": new_date, "user_id": user_id})
+            _note_user_update(user_id, c.fetchone())
 
     def update_weekly_score(self, user_id: int, score: float):
         """Kullanıcının haftalık üretkenlik skorunu günceller."""
@@ -226,18 +487,21 @@ class DatabaseManager:
             """, (score, user_id))
 
     def add_achievement(self, user_id: int, achievement: str):
-        """Yeni bir başarıyı kullanıcıya ekler."""
+        """Yeni bir başarıyı kullanıcıya ekler (zaten varsa atlar)."""
         with get_connection() as conn:
             c = conn.cursor()
-            c.execute("SELECT achievements FROM users WHERE id = ?", (user_id,))
-            row = c.fetchone()
-            if not row:
-                return
-            achievements = row["achievements"].split(",") if row["achievements"] else []
-            if achievement not in achievements:
-                achievements.append(achievement)
-                c.execute("UPDATE users SET achievements = ? WHERE id = ?",
-                          (",".join(achievements), user_id))
+            # Kullanıcı yoksa SELECT satır döndürmez, hiçbir şey eklenmez
+            c.execute("""
+                INSERT OR IGNORE INTO achievements (user_id, name)
+                SELECT id, ? FROM users WHERE id = ?
+            """, (achievement, user_id))
+
+    def get_achievements(self, user_id: int):
+        """Kullanıcının başarılarını eklenme sırasıyla döndürür."""
+        with get_connection() as conn:
+            c = conn.cursor()
+            c.execute("SELECT name FROM achievements WHERE user_id = ? ORDER BY id", (user_id,))
+            return [row["name"] for row in c.fetchall()]
 
     # ------------------------------------------------------------
     # ✅ TASK OPERATIONS
@@ -247,18 +511,23 @@ class DatabaseManager:
         """Yeni görev ekler."""
         with get_connection() as conn:
             c = conn.cursor()
-            c.execute("""
-                INSERT INTO tasks (user_id, title, priority, deadline, duration, status, strategy)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (user_id, title, priority, deadline, duration, status, strategy))
+            c.execute(_SQL_ADD_TASK, (user_id, title, priority, deadline, duration, status, strategy))
             return c.lastrowid
 
     def get_all_tasks(self, user_id: int):
         """Kullanıcının tüm görevlerini döndürür."""
         with get_connection() as conn:
             c = conn.cursor()
-            c.execute("SELECT * FROM tasks WHERE user_id = ?", (user_id,))
+            c.execute(_SQL_GET_ALL_TASKS, (user_id,))
+            return c.fetchall()
+
+    def get_pending_tasks(self, user_id: int, limit: int = 5):
+        """Öncelik sırasına göre ilk `limit` bekleyen görevi döndürür."""
+        with get_connection() as conn:
+            c = conn.cursor()
+            c.execute(_SQL_GET_PENDING_TASKS, (user_id, limit))
             return c.fetchall()
+        return []
 
     def update_task_status(self, task_id: int, new_status: str):
         """Görev durumunu günceller."""
@@ -282,12 +551,45 @@ class DatabaseManager:
         """Odak oturumunu kaydeder."""
         with get_connection() as conn:
             c = conn.cursor()
-            c.execute("""
-                INSERT INTO sessions (task_id, strategy, start_time, end_time, duration)
-                VALUES (?, ?, ?, ?, ?)
-            """, (task_id, strategy, start_time.isoformat(), end_time.isoformat(), duration))
+            c.execute(_SQL_LOG_SESSION,
+                      (task_id, strategy, start_time.isoformat(), end_time.isoformat(), duration))
             return c.lastrowid
 
+    def log_sessions_bulk(self, rows: list[tuple]):
+        """Birden çok oturumu tek transaction'da kaydeder.
+
+        Her satır: (task_id, strategy, start_time, end_time, duration).
+        Kaydedilen satır sayısını döndürür.
+        """
+        with get_connection() as conn:
+            c = conn.cursor()
+            c.executemany(_SQL_LOG_SESSION, (
+                (task_id, strategy, start.isoformat(), end.isoformat(), duration)
+                for task_id, strategy, start, end, duration in rows
+            ))
+            return c.rowcount
+        return 0
+
+    def complete_sessions(self, jobs):
+        """Biten odak oturumlarını (SessionWriteJob listesi) tek transaction'da yazar.
+
+        Yazmalar tamamlandıysa True, hata yüzünden geri alındıysa False döner
+        (get_connection hatayı yutar, çağıran ancak bu bayrakla anlayabilir).
+        """
+        written = False
+        with self.transaction(immediate=True):
+            self.log_sessions_bulk([
+                (job.task_id, job.strategy, job.start_time, job.end_time, job.minutes)
+                for job in jobs
+            ])
+            for job in jobs:
+                self.add_focus_minutes(job.user_id, job.minutes)
+                self.update_streak(job.user_id, job.end_time.isoformat())
+            for user_id in {job.user_id for job in jobs}:
+                self.update_average_session(user_id)
+            written = True
+        return written
+
     def get_sessions_for_task(self, task_id: int):
         """Belirli bir görevin tüm oturumlarını döndürür."""
         with get_connection() as conn:
@@ -307,29 +609,12 @@ class DatabaseManager:
             c = conn.cursor()
     
             # 🔹 USERS tablosundaki toplam süreyi güncelle
-            c.execute("""
-                UPDATE users
-                SET total_focus_minutes = total_focus_minutes + ?
-                WHERE id = ?
-            """, (minutes, user_id))
-    
-            # 🔹 USER_STATS tablosundaki toplam saati güncelle
-            c.execute("""
-                UPDATE user_stats
-                SET total_focus_hours = total_focus_hours + (? / 60.0)
-                WHERE user_id = ?
-            """, (minutes, user_id))
+            # (user_stats.total_focus_hours trg_users_focus_hours trigger'ı ile güncellenir)
+            c.execute(_SQL_ADD_FOCUS_MINUTES, (minutes, user_id))
+            _note_user_update(user_id, c.fetchone())
     
             # 🔹 DAILY_FOCUS tablosuna bugünün kaydını ekle/güncelle
-            c.execute("""
-                INSERT INTO daily_focus (user_id, date, focus_minutes)
-                VALUES (?, ?, ?)
-                ON CONFLICT(user_id, date)
-                DO UPDATE SET
-                    focus_minutes = focus_minutes + excluded.focus_minutes
-            """, (user_id, today, minutes))
-    
-            conn.commit()
+            c.execute(_SQL_UPSERT_DAILY_FOCUS, (user_id, today, minutes))
 
     
     def get_user_stats(self, user_id: int):
@@ -349,14 +634,28 @@ class DatabaseManager:
         with get_connection() as conn:
             c = conn.cursor()
             # Eğer kayıt varsa ekle, yoksa oluştur
-            c.execute("""
-                INSERT INTO daily_focus (user_id, date, focus_minutes)
-                VALUES (?, ?, ?)
-                ON CONFLICT(user_id, date) DO UPDATE SET
-                focus_minutes = focus_minutes + excluded.focus_minutes
-            """, (user_id, today, minutes))
-            conn.commit()
+            c.execute(_SQL_UPSERT_DAILY_FOCUS, (user_id, today, minutes))
     
+    def get_daily_focus_series(self, user_id: int, first_day: str, days: int = 7):
+        """first_day'den başlayan `days` günlük (date, focus_minutes) serisini tek sorguda döndürür."""
+        with get_connection() as conn:
+            c = conn.cursor()
+            c.execute(_SQL_DAILY_FOCUS_SERIES,
+                      {"first_day": first_day, "days": days, "user_id": user_id})
+            return c.fetchall()
+
+    def get_dashboard_data(self, user_id: int, first_day: str, days: int = 7):
+        """Dashboard'un okuduğu görevler ve günlük odak serisini tek transaction'da döndürür.
+
+        Arka plan thread'inden çağrılabilir; tüm okumalar aynı anlık görüntüden yapılır.
+        Kullanıcı satırı burada okunmaz, çağıran current_user'ı kullanır.
+        """
+        with get_connection():
+            return {
+                "tasks": self.get_all_tasks(user_id) if user_id else [],
+                "daily_focus": self.get_daily_focus_series(user_id, first_day, days),
+            }
+
     def get_best_day(self, user_id: int):
         """En çok odaklanılan günü döndürür."""
         with get_connection() as conn:
@@ -374,35 +673,32 @@ class DatabaseManager:
             return "N/A"
 
 
+    # update_user_stats ile güncellenebilecek user_stats sütunları
+    USER_STATS_COLUMNS = frozenset({
+        "total_focus_hours", "average_session", "best_day", "streak", "weekly_score",
+    })
+
     def update_user_stats(self, user_id: int, data: dict):
-        """Belirli alanları günceller."""
+        """Belirli alanları tek bir UPDATE ile günceller."""
+        unknown = set(data) - self.USER_STATS_COLUMNS
+        if unknown:
+            raise ValueError(f"Unknown user_stats column(s): {', '.join(sorted(unknown))}")
+        if not data:
+            return
+        # Sütun adları yukarıdaki izin listesinden geldiği için SQL'e eklenmesi güvenlidir
+        assignments = ", ".join(f"{key} = ?" for key in data)
         with get_connection() as conn:
             c = conn.cursor()
-            for key, value in data.items():
-                c.execute(f"UPDATE user_stats SET {key}=? WHERE user_id=?", (value, user_id))
+            c.execute(f"UPDATE user_stats SET {assignments} WHERE user_id = ?",
+                      (*data.values(), user_id))
     
     def update_average_session(self, user_id: int):
         """Kullanıcının ortalama oturum süresini (dakika cinsinden) günceller."""
         with get_connection() as conn:
             c = conn.cursor()
-            # Kullanıcının session kayıtlarından ortalama süreyi hesapla
-            c.execute("""
-                SELECT AVG(duration) AS avg_duration
-                FROM sessions
-                WHERE task_id IN (
-                    SELECT id FROM tasks WHERE user_id = ?
-                )
-            """, (user_id,))
+            c.execute(_SQL_UPDATE_AVERAGE_SESSION, (user_id, user_id))
             row = c.fetchone()
-            avg_duration = row["avg_duration"] if row and row["avg_duration"] else 0
-    
-            # user_stats tablosunu güncelle
-            c.execute("""
-                UPDATE user_stats
-                SET average_session = ?
-                WHERE user_id = ?
-            """, (avg_duration, user_id))
-            conn.commit()
+            avg_duration = row["average_session"] if row else 0
     
             print(f"✅ Updated average session for user {user_id}: {avg_duration:.2f} minutes")
 
@@ -431,15 +727,134 @@ class DatabaseManager:
         with get_connection() as conn:
             c = conn.cursor()
             c.execute("""
-                SELECT * FROM tasks
+                SELECT id, title, deadline, duration, strategy, priority, status
+                FROM tasks
                 WHERE user_id = ? AND status = 'done'
                 ORDER BY deadline DESC
             """, (user_id,))
             return c.fetchall()
 
-    def get_task_by_id(self, task_id: int):
-        """Tek bir görevi ID'ye göre döndürür."""
+    def get_completed_stats(self, user_id: int):
+        """Tamamlanan görev sayısı, toplam süre ve toplam görev sayısını tek sorguda döndürür."""
+        with get_connection() as conn:
+            c = conn.cursor()
+            c.execute("""
+                SELECT COUNT(*) AS total_tasks,
+                       COALESCE(SUM(status = 'done'), 0) AS completed,
+                       COALESCE(SUM(CASE WHEN status = 'done' THEN duration ELSE 0 END), 0) AS total_duration
+                FROM tasks
+                WHERE user_id = ?
+            """, (user_id,))
+            return dict(c.fetchone())
+
+    def get_status_counts(self, user_id: int):
+        """Kullanıcının görevlerini duruma göre sayar: {"done": n, "pending": m, ...}."""
         with get_connection() as conn:
             c = conn.cursor()
-            c.execute("SELECT * FROM tasks WHERE id = ?", (task_id,))
-            return c.fetchone()
+            # (user_id, status, ...) indexi üzerinden yalnızca index okunur
+            c.execute("""
+                SELECT status, COUNT(*) AS count
+                FROM tasks
+                WHERE user_id = ?
+                GROUP BY status
+            """, (user_id,))
+            return {row["status"]: row["count"] for row in c.fetchall()}
+        return {}
+
+    def get_focus_dashboard(self, user_id: int):
+        """Focus sayfası kartları için streak, toplam süre ve görev sayılarını tek sorguda döndürür."""
+        with get_connection() as conn:
+            c = conn.cursor()
+            c.execute("""
+                SELECT u.streak_days,
+                       u.total_focus_minutes,
+                       COALESCE(SUM(t.status = 'done'), 0)    AS done_count,
+                       COALESCE(SUM(t.status = 'pending'), 0) AS pending_count
+                FROM users u
+                LEFT JOIN tasks t ON t.user_id = u.id
+                WHERE u.id = ?
+                GROUP BY u.id
+            """, (user_id,))
+            row = c.fetchone()
+            if row:
+                return dict(row)
+        return {"streak_days": 0, "total_focus_minutes": 0, "done_count": 0, "pending_count": 0}
+
+    def get_task_by_id(self, task_id: int):
+        """Tek bir görevi ID'ye göre döndürür (son yazmaya kadar önbellekten)."""
+        task = _task_by_id_cached(task_id, _write_version)
+        return dict(task) if task else None
+
+
+# ============================================================
+# 🔹 Background Storage Worker
+# ============================================================
+class SessionWriteJob(NamedTuple):
+    """StorageWorker'a gönderilen, biten bir odak oturumunun yazma işi."""
+    user_id: int
+    minutes: int
+    task_id: int | None
+    strategy: str
+    start_time: datetime
+    end_time: datetime
+
+
+class StorageWorker(threading.Thread):
+    """Oturum yazmalarını arka plan thread'inde toplu olarak işler.
+
+    GUI thread'i submit() ile işi kuyruğa bırakıp hemen döner. Worker,
+    FLUSH_INTERVAL içinde gelen işleri tek transaction'da yazar ve her iş
+    için on_written(job) çağırır; transaction geri alınırsa bunun yerine
+    on_failed(job) çağrılır (ikisi de worker thread'inden).
+    """
+
+    FLUSH_INTERVAL = 0.1  # saniye
+
+    def __init__(self, on_written=None, on_failed=None):
+        super().__init__(name="StorageWorker", daemon=True)
+        self._queue = queue.SimpleQueue()
+        self._on_written = on_written
+        self._on_failed = on_failed
+        # Çıkışta kuyrukta kalan işler yazılmadan süreç kapanmasın
+        atexit.register(self.stop)
+
+    def submit(self, job: SessionWriteJob) -> None:
+        """Bir yazma işini kuyruğa ekler (bloklamaz)."""
+        self._queue.put(job)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Kuyruktaki işleri bitirip thread'i durdurur."""
+        if self.is_alive():
+            self._queue.put(None)
+            self.join(timeout)
+
+    def run(self):
+        db = DatabaseManager()  # bu thread'in kendi bağlantısını açar
+        running = True
+        while running:
+            job = self._queue.get()
+            if job is None:
+                break
+            batch = [job]
+            deadline = time.monotonic() + self.FLUSH_INTERVAL
+            while (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    job = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if job is None:
+                    running = False
+                    break
+                batch.append(job)
+            # Tek bir hatalı batch veya callback worker'ı durdurmasın; sonraki işler yazılmaya devam eder
+            try:
+                self._write_batch(db, batch)
+            except Exception as e:
+                print(f"❌ Storage worker error: {e}")
+
+    def _write_batch(self, db, batch):
+        # Geri alındıysa UI'a "kaydedildi" değil, "kaydedilemedi" bildirilir
+        callback = self._on_written if db.complete_sessions(batch) else self._on_failed
+        if callback is not None:
+            for job in batch:
+                callback(job)
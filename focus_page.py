@@ -14,29 +14,33 @@ Light UI version of Focus Mode with identical backend logic:
 |---------------------------------------|------------------------------------------------------------------|------------------------------|-----------|
 | `self.db`                             | `DatabaseManager()` instance                                     | 🔹 Database Connection        | Provides CRUD operations for users, tasks, sessions, and statistics. |
 | `self.user_email`                     | `"dogukan@example.com"` (hardcoded for active session)           | 🔸 Local Constant             | Used for retrieving or creating user data in the database. |
-| `user_data`                           | `self.db.get_user_by_email(self.user_email)`                     | 🔹 Database Query             | Returns current user record (id, streak_days, total_focus_minutes). |
+| `user_data`                           | `self.db.current_user`                                           | 🔹 Database (cached)          | Session user record (id, streak_days, total_focus_minutes), kept current by writes. |
 | `self.user_id`                        | From `user_data["id"]` or created by `self.db.add_user()`        | 🔹 Database Derived           | Primary key of current user. |
 | `self.user`                           | `User("dogukanavci", self.user_email)`                           | 🔸 Local Object               | High-level wrapper around user-related logic. |
 | `self.strategy_name`                  | Default `"pomodoro"` / updated via `change_strategy()`           | 🔸 Local State Variable       | Determines focus logic type: pomodoro / deepwork / balanced. |
 | `self.strategy`                       | `StrategyFactory.create(self.strategy_name)`                     | 🔸 Local Object (Strategy)    | Strategy instance controlling timing behavior. |
 | `self.planner`                        | `Planner(self.user, self.strategy)`                              | 🔸 Local Object (Composition) | Manages the task list and executes strategy logic. |
-| `self.timer`                          | `QTimer()` (interval = 1 s)                                      | 🔸 UI Timer                   | Countdown timer triggering `update_timer()` every second. |
+| `self.timer`                          | `QTimer()` (single-shot)                                         | 🔸 UI Timer                   | Re-armed by `_schedule_tick()` to fire `update_timer()` on each elapsed-second boundary. |
 | `self.remaining_time`                 | Integer (seconds)                                                | 🔸 Runtime Variable           | Remaining seconds for the active focus session. |
 | `self.total_duration`                 | `duration * 60`                                                  | 🔸 Runtime Variable           | Total focus time for selected strategy in seconds. |
 | `self.is_running`, `self.is_paused`   | Boolean flags                                                    | 🔸 State Variables            | Indicate current session activity. |
 | `self.session_start_time`             | `datetime.datetime.now()`                                        | 🔸 Runtime Variable           | Timestamp of when session started. |
+| `self._run_started`                   | `time.monotonic()`                                               | 🔸 Runtime Variable           | Monotonic clock reading when the timer last started/resumed. |
+| `self._elapsed_before_pause`          | Float (seconds)                                                  | 🔸 Runtime Variable           | Running time accumulated before the current run (pauses excluded). |
 | `self.current_task_id`                | Task ID or `None`                                                | 🔸 Local Variable (Nullable)  | Associates session with a specific task (if applicable). |
 | `self.circular_progress`              | `ModernCircularProgress()`                                       | 🔸 UI Widget                  | Custom widget rendering gradient circular progress. |
-| `self.time_label`                     | `QLabel("25:00")`                                                | 🔸 UI Element                 | Displays countdown (MM:SS). Updated every second. |
+| `self.time_label`                     | `StaticTextLabel("25:00", ...)`                                  | 🔸 UI Element                 | Displays countdown (MM:SS). Updated every second. |
 | `self.strategy_combo`                 | `QComboBox()`                                                    | 🔸 UI Element                 | Dropdown for strategy selection (Pomodoro, DeepWork, Balanced). |
 | `self.task_list_layout`               | `QVBoxLayout()`                                                  | 🔸 UI Container               | Holds `ModernTaskCard` widgets for pending tasks. |
+| `self._task_card_by_id`               | `dict[int, ModernTaskCard]`                                      | 🔸 UI References              | Visible task cards (at most `MAX_TASK_CARDS`), reused while the task is unchanged. |
+| `self._shown_task_keys`               | `tuple[tuple[int, tuple], ...]`                                  | 🔸 UI State                   | Task ids and card keys last rendered; an equal tuple skips `refresh_task_list`. |
 | `self.stats_value_labels`             | `list[QLabel]`                                                   | 🔸 UI References              | References to value labels in stat cards for live refresh. |
+| `self._stat_values`                   | `list[tuple]`                                                    | 🔸 UI State                   | Values each stat card shows; `_set_stat()` skips formatting and `setText` when they match. |
 | `self.start_btn`, `pause_btn`, etc.   | `QPushButton()` controls                                          | 🔸 UI Controls                | Buttons for session management (Start, Pause, Continue, Complete, Reset). |
 | `self.status_label`                   | `QLabel()`                                                       | 🔸 UI Feedback Element        | Displays textual state of current session. |
-| `completed_count`                     | `sum(1 for t in all_tasks if t["status"] == "done")`             | 🔹 Database Derived           | Total number of completed tasks. |
-| `pending_count`                       | `sum(1 for t in all_tasks if t["status"] == "pending")`          | 🔹 Database Derived           | Total number of pending tasks. |
+| `self._task_counts`                   | `get_status_counts` / `get_focus_dashboard` counts               | 🔹 Database Derived (cached)  | Completed / pending task counts; adjusted in place on status changes, resynced by `refresh_stats()`. |
 | `stats_data`                          | Local list of (icon, title, value, color)                        | 🔸 Local Data Structure       | Populates StatCard widgets. |
-| `elapsed_seconds`                     | `self.total_duration - self.remaining_time`                      | 🔸 Calculated Local           | Total seconds elapsed in current session. |
+| `elapsed_seconds`                     | `self._elapsed_seconds()` (capped at `total_duration`)           | 🔸 Calculated Local           | Total seconds elapsed in current session. |
 | `duration_minutes`                    | `max(1, elapsed_seconds / 60)`                                   | 🔸 Calculated Local           | Converted minutes (minimum 1 min for DB logging). |
 | `self.db.add_focus_minutes()`         | Database write                                                   | 🔹 Database Update            | Increases user’s total focus time. |
 | `self.db.update_streak()`             | Database write                                                   | 🔹 Database Update            | Updates streak based on session completion date. |
@@ -45,16 +49,17 @@ Light UI version of Focus Mode with identical backend logic:
 
 ⚙️ Functional Event Flow
 ------------------------
-1. **change_strategy(index)** → Updates `self.strategy_name`, sets new duration, updates combo box display.  
-2. **start_focus()** → Initializes session timers, sets total duration, and starts countdown (`QTimer.start(1000)`).  
-3. **update_timer()** → Decrements remaining time, updates circular progress, refreshes label each second.  
-4. **pause_focus() / continue_focus()** → Toggle `self.is_running` and `self.is_paused`, controlling timer state.  
+1. **change_strategy(index)** → Debounced (150 ms); the final selection updates `self.strategy_name`, sets new duration, updates combo box display.  
+2. **start_focus()** → Initializes session timers, sets total duration, and starts the countdown via `_schedule_tick()` (single-shot precise timer re-armed for each elapsed-second boundary).  
+3. **update_timer()** → Recomputes remaining time from the monotonic clock (drift-free), updates circular progress, refreshes label, then re-arms the next tick with `_schedule_tick()`.  
+4. **pause_focus() / continue_focus()** → Toggle `self.is_running` and `self.is_paused`, controlling timer state; pause time is excluded from elapsed time.  
 5. **complete_session()** →  
    - Stops timer  
    - Calculates elapsed minutes  
-   - Updates database (`add_focus_minutes`, `update_streak`, `update_average_session`, `log_session`)  
-   - Refreshes UI (stats, task list) and shows confirmation dialog.  
-6. **refresh_stats()** → Reloads database metrics and updates stat cards dynamically.  
+   - Queues the write on the background `StorageWorker` (focus minutes, streak, average session, session log in one transaction)  
+   - `sessionSaved(minutes, user_row)` fires once the write lands → shows confirmation dialog, then `refresh_stats()` resyncs all four cards.  
+   - `sessionFailed(minutes)` fires if the transaction is rolled back → restores the status label and shows a warning.  
+6. **refresh_stats()** → Reloads all card metrics in one query (`get_focus_dashboard`); runs after each saved session and whenever the page is opened (`load_pending_tasks()`).  
 7. **reset_focus()** → Restores default UI and clears runtime variables.
 
 💡 Data Category Legend
@@ -65,7 +70,7 @@ Light UI version of Focus Mode with identical backend logic:
 💬 Notes
 --------
 - The UI runs on a pure white gradient background for minimal eye strain.  
-- `ModernCircularProgress` provides smooth progress drawing using gradient pens (blue → purple).  
+- `ModernCircularProgress` provides smooth progress drawing with pens cached on the widget.  
 - Database synchronization occurs **only** after `complete_session()`.  
 - `refresh_stats()` ensures user metrics (focus time, streak, tasks) are instantly updated after each session.  
 - The class maintains **full backend parity** with the dark “Premium Focus Mode” version for seamless theme switching.
@@ -73,18 +78,19 @@ Light UI version of Focus Mode with identical backend logic:
 """
 
 
-import random
+import math
 import datetime
+import time
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QComboBox, QMessageBox, QGraphicsDropShadowEffect,
-    QFrame, QScrollArea, QProgressBar
+    QComboBox, QMessageBox, QGraphicsBlurEffect, QGraphicsPixmapItem,
+    QGraphicsScene, QFrame, QScrollArea, qDrawBorderPixmap
 )
-from PyQt5.QtCore import Qt, QTimer, QPoint, pyqtProperty, QPropertyAnimation, QEasingCurve
-from PyQt5.QtGui import QFont, QPainter, QPen, QColor, QBrush, QLinearGradient, QPainterPath
+from PyQt5.QtCore import Qt, QTimer, QPointF, QRect, QRectF, QMargins, pyqtProperty, pyqtSignal
+from PyQt5.QtGui import QFont, QFontMetrics, QPainter, QPen, QColor, QPainterPath, QImage, QPixmap, QStaticText
 
 # Backend Integration
-from database import DatabaseManager
+from database import DatabaseManager, SessionWriteJob, StorageWorker
 from core.user import User
 from core.task import Task
 from core.planner import Planner
@@ -95,11 +101,18 @@ from strategies.factory import StrategyFactory
 # 🎨 Modern Circular Progress (White Theme)
 # ============================================================
 class ModernCircularProgress(QWidget):
+    RING_WIDTH = 18
+    BG_COLOR = QColor("#E8EEF5")
+    FG_COLOR = QColor("#667EEA")
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(280, 280)
         self._progress = 0
         self._max_value = 100
+        self._angle16 = 0   # progress as a drawArc span (1/16 degrees)
+        self._wedge = None  # clip path for the current span, rebuilt when it changes
+        self._resize_rings()
         
     @pyqtProperty(int)
     def progress(self):
@@ -108,68 +121,231 @@ class ModernCircularProgress(QWidget):
     @progress.setter
     def progress(self, value):
         self._progress = value
-        self.update()
+        angle16 = value * 360 * 16 // self._max_value
+        # Repaint only when the drawn arc actually changes
+        if angle16 != self._angle16:
+            self._angle16 = angle16
+            self._wedge = None
+            self.update()
+    
+    def resizeEvent(self, event):
+        self._resize_rings()
+        super().resizeEvent(event)
+    
+    def _resize_rings(self):
+        """Size-dependent geometry; the ring pixmaps are rasterized lazily on the next paint"""
+        self._arc_rect = QRect(20, 20, self.width() - 40, self.height() - 40)
+        self._bg_pixmap = self._fg_pixmap = None
+        self._wedge = None
+    
+    def _ring_pixmap(self, color):
+        """Stroke the full ring once into a pixmap at the screen's pixel ratio"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(color, self.RING_WIDTH))
+        painter.drawEllipse(self._arc_rect)
+        painter.end()
+        return pixmap
+    
+    def _arc_point(self, degrees):
+        """Point on the ring's centre line at the given angle (0° = 3 o'clock, counter-clockwise)"""
+        center = QRectF(self._arc_rect).center()
+        radius = self._arc_rect.width() / 2
+        rad = math.radians(degrees)
+        return QPointF(center.x() + radius * math.cos(rad), center.y() - radius * math.sin(rad))
     
     def paintEvent(self, event):
-        width = self.width()
-        height = self.height()
+        if self._bg_pixmap is None:
+            self._bg_pixmap = self._ring_pixmap(self.BG_COLOR)
+            self._fg_pixmap = self._ring_pixmap(self.FG_COLOR)
         
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
         # Background circle (light gray)
-        pen = QPen()
-        pen.setWidth(18)
-        pen.setColor(QColor("#E8EEF5"))
-        pen.setCapStyle(Qt.RoundCap)
-        painter.setPen(pen)
-        painter.drawArc(20, 20, width-40, height-40, 0, 360 * 16)
-        
-        # Progress arc (gradient blue to purple)
-        gradient = QLinearGradient(0, 0, width, height)
-        gradient.setColorAt(0, QColor("#667EEA"))
-        gradient.setColorAt(1, QColor("#764BA2"))
-        
-        pen.setBrush(QBrush(gradient))
-        pen.setColor(QColor("#667EEA"))
-        painter.setPen(pen)
+        painter.drawPixmap(0, 0, self._bg_pixmap)
+        if not self._angle16:
+            return
         
-        angle = int(self._progress * 360 / self._max_value * 16)
-        painter.drawArc(20, 20, width-40, height-40, 90 * 16, -angle)
+        # Progress arc: blit the pre-stroked ring through a wedge clip...
+        span = self._angle16 / 16
+        if self._wedge is None:
+            outer = QRectF(self.rect())
+            self._wedge = QPainterPath(outer.center())
+            self._wedge.arcTo(outer, 90, -span)
+            self._wedge.closeSubpath()
+        painter.save()
+        painter.setClipPath(self._wedge)
+        painter.drawPixmap(0, 0, self._fg_pixmap)
+        painter.restore()
+        
+        # ...then add the round caps at both ends
+        cap = self.RING_WIDTH / 2
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self.FG_COLOR)
+        painter.drawEllipse(self._arc_point(90), cap, cap)
+        painter.drawEllipse(self._arc_point(90 - span), cap, cap)
 
 
 # ============================================================
-# 🎨 Clean White Card
+# 🎨 Card Helpers
 # ============================================================
-class CleanCard(QFrame):
-    def __init__(self, parent=None):
+_shadow_pixmaps = {}
+
+
+def _shadow_pixmap(margin, radius, color, dy):
+    """Blur a rounded rect once into a nine-slice shadow pixmap (cached per style)"""
+    key = (margin, radius, color.rgba(), dy)
+    pixmap = _shadow_pixmaps.get(key)
+    if pixmap is None:
+        size = 2 * (margin + radius) + 1
+        shape = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+        shape.fill(Qt.transparent)
+        painter = QPainter(shape)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(color)
+        painter.drawRoundedRect(margin, margin + dy, 2 * radius + 1, 2 * radius + 1, radius, radius)
+        painter.end()
+        
+        # Blur through a throwaway scene, the same blur Qt's shadow effect runs per paint
+        item = QGraphicsPixmapItem(QPixmap.fromImage(shape))
+        blur = QGraphicsBlurEffect()
+        blur.setBlurRadius(margin)
+        item.setGraphicsEffect(blur)
+        scene = QGraphicsScene()
+        scene.addItem(item)
+        pixmap = QPixmap(size, size)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        scene.render(painter, QRectF(0, 0, size, size), QRectF(0, 0, size, size))
+        # Styled backgrounds are painted before paintEvent, so keep the card body clear
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setCompositionMode(QPainter.CompositionMode_Clear)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(Qt.black)
+        painter.drawRoundedRect(margin, margin, 2 * radius + 1, 2 * radius + 1, radius, radius)
+        painter.end()
+        _shadow_pixmaps[key] = pixmap
+    return pixmap
+
+
+class StaticTextLabel(QWidget):
+    """Single-line label drawn from a QStaticText, re-laid out only when the text changes"""
+    
+    def __init__(self, text, font, color, alignment=Qt.AlignLeft, parent=None):
         super().__init__(parent)
-        self.setStyleSheet("""
+        self.setFont(font)
+        self._color = QColor(color)
+        self._alignment = alignment
+        self._line_height = QFontMetrics(font).height()
+        self._text = None
+        self._static = QStaticText()
+        self._static.setTextFormat(Qt.PlainText)
+        self.setText(text)
+    
+    def text(self):
+        return self._text
+    
+    def setText(self, text):
+        if text == self._text:
+            return
+        self._text = text
+        self._static.setText(text)
+        self._static.prepare(font=self.font())
+        self.updateGeometry()
+        self.update()
+    
+    def sizeHint(self):
+        size = self._static.size().toSize()
+        margins = self.contentsMargins()
+        return size.grownBy(margins)
+    
+    def minimumSizeHint(self):
+        return self.sizeHint()
+    
+    def paintEvent(self, event):
+        rect = self.contentsRect()
+        x = rect.x()
+        if self._alignment & Qt.AlignHCenter:
+            # Like QLabel, text wider than the rect overflows on both sides
+            x += int((rect.width() - self._static.size().width()) / 2)
+        y = rect.y() + int((rect.height() - self._line_height) / 2)
+        painter = QPainter(self)
+        painter.setPen(self._color)
+        painter.drawStaticText(x, y, self._static)
+
+
+def _paint_shadow(widget, shadow):
+    """Stretch the cached shadow for `shadow` = (margin, radius, colour, dy) over the widget"""
+    margin, radius, color, dy = shadow
+    edge = margin + radius
+    painter = QPainter(widget)
+    qDrawBorderPixmap(painter, widget.rect(), QMargins(edge, edge, edge, edge),
+                      _shadow_pixmap(margin, radius, color, dy))
+    painter.end()
+
+
+class _ShadowFrame(QFrame):
+    """QFrame that paints a pre-rendered shadow inside its stylesheet margin"""
+    # (margin, corner radius, colour, y offset); the margin must match the QSS one
+    SHADOW = (0, 0, QColor(0, 0, 0, 0), 0)
+    
+    def paintEvent(self, event):
+        _paint_shadow(self, self.SHADOW)
+        super().paintEvent(event)
+
+
+class _ShadowButton(QPushButton):
+    """QPushButton with the same pre-rendered shadow; the QSS must set `margin: 5px`"""
+    SHADOW = (5, 12, QColor(102, 126, 234, 60), 4)
+    
+    def paintEvent(self, event):
+        _paint_shadow(self, self.SHADOW)
+        super().paintEvent(event)
+
+
+# ============================================================
+# 🎨 Clean White Card
+# ============================================================
+class CleanCard(_ShadowFrame):
+    _QSS = """
             QFrame {
                 background: white;
                 border: 1px solid #E2E8F0;
                 border-radius: 16px;
                 padding: 20px;
             }
-        """)
-        
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(25)
-        shadow.setColor(QColor(100, 116, 139, 40))
-        shadow.setOffset(0, 4)
-        self.setGraphicsEffect(shadow)
+            CleanCard { margin: 8px; }
+        """
+    SHADOW = (8, 16, QColor(100, 116, 139, 40), 4)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setStyleSheet(self._QSS)
 
 
 # ============================================================
 # 🎨 Stat Card (White Theme)
 # ============================================================
-class StatCard(QFrame):
+class StatCard(_ShadowFrame):
+    # Stylesheets per accent colour, shared by every card with that colour
+    _qss_cache: dict[str, tuple[str, str]] = {}
+    SHADOW = (6, 14, QColor(0, 0, 0, 20), 2)
+    
     def __init__(self, icon, title, value, color, parent=None):
         super().__init__(parent)
-        self.setMinimumHeight(140)
-        self.setMinimumWidth(150)
+        # Sizes include the 6px shadow margin on each side
+        self.setMinimumHeight(152)
+        self.setMinimumWidth(162)
         
-        self.setStyleSheet(f"""
+        qss = self._qss_cache.get(color)
+        if qss is None:
+            qss = self._qss_cache[color] = (f"""
             QFrame {{
                 background: white;
                 border: 2px solid {color}30;
@@ -180,7 +356,10 @@ class StatCard(QFrame):
                 border: 2px solid {color}60;
                 background: {color}08;
             }}
-        """)
+            StatCard {{ margin: 6px; }}
+        """, f"color: {color}; border: none; background: transparent;")
+        card_qss, value_qss = qss
+        self.setStyleSheet(card_qss)
         
         layout = QVBoxLayout(self)
         layout.setSpacing(10)
@@ -207,37 +386,39 @@ class StatCard(QFrame):
         # Value
         self.value_label = QLabel(value)
         self.value_label.setFont(QFont("Segoe UI", 24, QFont.Bold))
-        self.value_label.setStyleSheet(f"color: {color}; border: none; background: transparent;")
+        self.value_label.setStyleSheet(value_qss)
         self.value_label.setWordWrap(False)
         
         layout.addLayout(header)
         layout.addWidget(self.value_label)
         layout.addStretch()
-        
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(20)
-        shadow.setColor(QColor(0, 0, 0, 20))
-        shadow.setOffset(0, 2)
-        self.setGraphicsEffect(shadow)
 
 
 # ============================================================
 # 🎨 Task Card (White Theme)
 # ============================================================
-class ModernTaskCard(QFrame):
+class ModernTaskCard(_ShadowFrame):
+    COLORS = {
+        1: "#EF4444",  # Red
+        2: "#F59E0B",  # Orange
+        3: "#3B82F6",  # Blue
+        4: "#10B981"   # Green
+    }
+    # Stylesheets per priority colour, shared by every card with that colour
+    _qss_cache: dict[str, str] = {}
+    SHADOW = (4, 10, QColor(0, 0, 0, 15), 2)
+    _INFO_FONT = QFont("Segoe UI", 10, QFont.DemiBold)
+    
     def __init__(self, task_title, priority, duration, parent=None):
         super().__init__(parent)
-        self.setMinimumHeight(85)
+        self.setMinimumHeight(93)  # includes the 4px shadow margin
+        self.task_key = (task_title, priority, duration)
         
-        colors = {
-            1: "#EF4444",  # Red
-            2: "#F59E0B",  # Orange
-            3: "#3B82F6",  # Blue
-            4: "#10B981"   # Green
-        }
-        color = colors.get(priority, "#64748B")
+        color = self.COLORS.get(priority, "#64748B")
         
-        self.setStyleSheet(f"""
+        qss = self._qss_cache.get(color)
+        if qss is None:
+            qss = self._qss_cache[color] = f"""
             QFrame {{
                 background: white;
                 border-left: 4px solid {color};
@@ -247,7 +428,9 @@ class ModernTaskCard(QFrame):
             QFrame:hover {{
                 background: #F8FAFC;
             }}
-        """)
+            ModernTaskCard {{ margin: 4px; }}
+        """
+        self.setStyleSheet(qss)
         
         layout = QVBoxLayout(self)
         layout.setSpacing(6)
@@ -259,36 +442,135 @@ class ModernTaskCard(QFrame):
         title.setStyleSheet(f"color: #1E293B; background: transparent; border: none;")
         
         # Info
-        info = QLabel(f"P{priority} • {duration} min")
-        info.setFont(QFont("Segoe UI", 10))
-        info.setStyleSheet(f"color: {color}; background: transparent; border: none; font-weight: 600;")
+        info = StaticTextLabel(f"P{priority} • {duration} min", self._INFO_FONT, color)
+        info.setContentsMargins(18, 14, 14, 14)  # the padding the card QSS gave its QLabel
         
         layout.addWidget(title)
         layout.addWidget(info)
-        
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(12)
-        shadow.setColor(QColor(0, 0, 0, 15))
-        shadow.setOffset(0, 2)
-        self.setGraphicsEffect(shadow)
+
+
+# ============================================================
+# 🎨 Focus Page Stylesheets (parsed once per process, not per init_ui)
+# ============================================================
+# Page background plus the control buttons; the buttons match by class and
+# object name so dialogs parented to the page keep their default look.
+_PAGE_QSS = """
+    QWidget {
+        background: qlineargradient(
+            x1:0, y1:0, x2:0, y2:1,
+            stop:0 #FFFFFF,
+            stop:1 #F8FAFC
+        );
+    }
+    _ShadowButton, QPushButton#completeButton {
+        background: #667EEA;
+        color: white;
+        border: none;
+        border-radius: 12px;
+        margin: 5px;
+        padding: 14px 24px;
+        font-size: 12pt;
+        font-weight: 600;
+    }
+    _ShadowButton:hover {
+        background: #5568D3;
+    }
+    _ShadowButton:pressed {
+        background: #4C51BF;
+    }
+    QPushButton#completeButton {
+        background: #10B981;
+    }
+    QPushButton#completeButton:hover {
+        background: #059669;
+    }
+    QPushButton#completeButton:pressed {
+        background: #047857;
+    }
+"""
+
+_COMBO_QSS = """
+    QComboBox {
+        background: #F8FAFC;
+        border: 2px solid #E2E8F0;
+        border-radius: 10px;
+        padding: 12px 16px;
+        color: #1E293B;
+        font-size: 11pt;
+        font-weight: 600;
+    }
+    QComboBox:hover {
+        border: 2px solid #667EEA;
+    }
+    QComboBox::drop-down {
+        border: none;
+        width: 30px;
+    }
+    QComboBox QAbstractItemView {
+        background: white;
+        color: #1E293B;
+        selection-background-color: #667EEA;
+        border: 1px solid #E2E8F0;
+        border-radius: 8px;
+    }
+"""
+
+_SCROLL_QSS = """
+    QScrollArea {
+        background: transparent;
+        border: none;
+    }
+    QScrollBar:vertical {
+        background: #F1F5F9;
+        width: 8px;
+        border-radius: 4px;
+    }
+    QScrollBar::handle:vertical {
+        background: #CBD5E1;
+        border-radius: 4px;
+    }
+"""
 
 
 # ============================================================
 # 🎯 Focus Page - Modern White Theme
 # ============================================================
 class FocusPage(QWidget):
+    # Emitted (queued to the GUI thread) once a session write has been committed,
+    # with the minutes saved and a snapshot of the user row taken right after the commit
+    sessionSaved = pyqtSignal(int, dict)
+    # Emitted (queued to the GUI thread) when a session write was rolled back, with the minutes lost
+    sessionFailed = pyqtSignal(int)
+    
+    # Upper bound on task cards in the side list, however many tasks are pending
+    MAX_TASK_CARDS = 5
+    # Strategy combo box entries, by index: factory name and session length in minutes
+    STRATEGY_NAMES = ("pomodoro", "deepwork", "balanced")
+    STRATEGY_MINUTES = (25, 90, 45)
+    # Value templates of the four stat cards, in card order
+    STAT_FORMATS = ("{} days", "{}h {}m", "{} tasks", "{} tasks")
+    # "MM:SS" for every remaining second of the longest session, indexed by seconds
+    TIME_STRINGS = tuple(f"{s // 60:02}:{s % 60:02}" for s in range(max(STRATEGY_MINUTES) * 60 + 1))
+
     def __init__(self, parent=None):
         super().__init__(parent)
         
         # Database setup
         self.db = DatabaseManager()
+        self.storage = StorageWorker(on_written=self._emit_session_saved,
+                                     on_failed=self._emit_session_failed)
+        self.sessionSaved.connect(self._on_session_saved)
+        self.sessionFailed.connect(self._on_session_failed)
+        self.storage.start()
         self.user_email = "dogukan@example.com"
-        user_data = self.db.get_user_by_email(self.user_email)
+        user_data = self.db.current_user
+        if not user_data or user_data["email"] != self.user_email:
+            user_data = self.db.set_current_user(self.user_email)
         
         if not user_data:
-            self.user_id = self.db.add_user("dogukanavci", self.user_email)
-        else:
-            self.user_id = user_data["id"]
+            self.db.add_user("dogukanavci", self.user_email)
+            user_data = self.db.set_current_user(self.user_email)
+        self.user_id = user_data["id"]
         
         # Core backend integration
         self.user = User("dogukanavci", self.user_email)
@@ -300,60 +582,122 @@ class FocusPage(QWidget):
         
         # Timer variables
         self.timer = QTimer()
+        self.timer.setSingleShot(True)  # re-armed by _schedule_tick for each second boundary
+        self.timer.setTimerType(Qt.PreciseTimer)
         self.timer.timeout.connect(self.update_timer)
+        
+        # Rapid strategy changes (e.g. arrow keys) settle into one rebuild
+        self._strategy_debounce = QTimer(self)
+        self._strategy_debounce.setSingleShot(True)
+        self._strategy_debounce.setInterval(150)
+        self._strategy_debounce.timeout.connect(self._apply_strategy_change)
+        self._pending_strategy_index = None
         self.remaining_time = 0
         self.total_duration = 0
         self.is_running = False
         self.is_paused = False
         self.session_start_time = None
         self.current_task_id = None
+        self._run_started = 0.0
+        self._elapsed_before_pause = 0.0
+        self._last_progress = 0  # last percentage handed to the progress ring
         
         self.init_ui()
     
     def load_tasks_to_planner(self):
-        """Load pending tasks from database"""
-        db_tasks = self.db.get_all_tasks(self.user_id)
+        """Load the pending tasks shown in the side list from database"""
+        db_tasks = self.db.get_pending_tasks(self.user_id, self.MAX_TASK_CARDS)
         for db_task in db_tasks:
-            if db_task["status"] == "pending":
-                deadline = datetime.datetime.fromisoformat(db_task["deadline"]) if db_task["deadline"] else None
-                task = Task(
-                    db_task["id"],
-                    db_task["priority"],
-                    db_task["title"],
-                    deadline,
-                    db_task["duration"],
-                    db_task["status"]
-                )
-                self.planner.add_task(task)
+            self.planner.add_task(self._task_from_row(db_task))
+    
+    @staticmethod
+    def _task_from_row(db_task):
+        """Build a Task from a tasks table row"""
+        deadline = datetime.datetime.fromisoformat(db_task["deadline"]) if db_task["deadline"] else None
+        return Task(
+            db_task["id"],
+            db_task["priority"],
+            db_task["title"],
+            deadline,
+            db_task["duration"],
+            db_task["status"]
+        )
     
     def load_pending_tasks(self):
-        """Reload pending tasks"""
-        self.planner = Planner(self.user, self.strategy)
-        self.load_tasks_to_planner()
+        """Reload pending tasks, keeping the Task objects that are still listed"""
+        db_tasks = self.db.get_pending_tasks(self.user_id, self.MAX_TASK_CARDS)
+        current = self.planner.get_tasks()
+        known = {task.get_taskid(): task for task in current}
+        
+        wanted = []
+        for db_task in db_tasks:
+            task = known.get(db_task["id"])
+            if task is None:
+                task = self._task_from_row(db_task)
+            else:
+                # Copy edits onto the kept task; setters re-sort it in the planner
+                deadline = datetime.datetime.fromisoformat(db_task["deadline"]) if db_task["deadline"] else None
+                if task.get_title() != db_task["title"]:
+                    task.set_title(db_task["title"])
+                if task.get_priority() != db_task["priority"]:
+                    task.set_priority(db_task["priority"])
+                if task.get_deadline() != deadline:
+                    task.set_deadline(deadline)
+                if task.get_duration() != db_task["duration"]:
+                    task.set_duration(db_task["duration"])
+            wanted.append(task)
+        
+        # The card list follows planner order, so re-seat the tasks only when it differs
+        if current != wanted:
+            for task in list(current):
+                self.planner.remove_task(task)
+            for task in wanted:
+                self.planner.add_task(task)
         self.refresh_task_list()
+        # Tasks may have been added, restored or deleted on other pages
+        self.refresh_stats()
     
     def refresh_task_list(self):
-        """Refresh task list UI"""
-        if hasattr(self, 'task_list_layout'):
-            while self.task_list_layout.count():
-                item = self.task_list_layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
-            
-            pending_tasks = self.planner.filter_tasks("pending")
+        """Refresh task list UI, only adding/removing the cards that changed"""
+        if not hasattr(self, 'task_list_layout'):
+            return
+        
+        # The planner only holds the pending tasks loaded for this list
+        shown = tuple(
+            (task.get_taskid(), (task.get_title(), task.get_priority(), task.get_duration()))
+            for task in self.planner.get_tasks()
+        )
+        if shown == self._shown_task_keys:
+            return  # same tasks, same order: nothing to add, remove or move
+        self._shown_task_keys = shown
+        wanted = dict(shown)
+        
+        # Freeze the list while cards move so the layout settles in one pass
+        container = self.task_list_layout.parentWidget()
+        container.setUpdatesEnabled(False)
+        try:
+            # Drop cards whose task left the list or was edited
+            for task_id, card in list(self._task_card_by_id.items()):
+                if wanted.get(task_id) != card.task_key:
+                    self.task_list_layout.removeWidget(card)
+                    card.deleteLater()
+                    del self._task_card_by_id[task_id]
             
-            if pending_tasks:
-                for task in pending_tasks[:5]:
-                    card = ModernTaskCard(task.get_title(), task.get_priority(), task.get_duration())
-                    self.task_list_layout.addWidget(card)
-            else:
-                no_tasks = QLabel("No pending tasks ✨")
-                no_tasks.setFont(QFont("Segoe UI", 11))
-                no_tasks.setAlignment(Qt.AlignCenter)
-                no_tasks.setStyleSheet("color: #94A3B8; background: transparent; padding: 30px;")
-                self.task_list_layout.addWidget(no_tasks)
+            # Create missing cards and put every card in list order (before the empty label)
+            for index, (task_id, key) in enumerate(wanted.items()):
+                card = self._task_card_by_id.get(task_id)
+                if card is None:
+                    card = ModernTaskCard(*key)
+                    self._task_card_by_id[task_id] = card
+                elif self.task_list_layout.indexOf(card) == index:
+                    continue
+                else:
+                    self.task_list_layout.removeWidget(card)
+                self.task_list_layout.insertWidget(index, card)
             
-            self.task_list_layout.addStretch()
+            self._no_tasks_label.setVisible(not wanted)
+        finally:
+            container.setUpdatesEnabled(True)
     
     def init_ui(self):
         # Main layout
@@ -361,15 +705,7 @@ class FocusPage(QWidget):
         main_layout.setContentsMargins(0, 0, 0, 0)
         
         # Clean white background
-        self.setStyleSheet("""
-            QWidget {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #FFFFFF,
-                    stop:1 #F8FAFC
-                );
-            }
-        """)
+        self.setStyleSheet(_PAGE_QSS)
         
         # Content
         content = QWidget()
@@ -400,22 +736,29 @@ class FocusPage(QWidget):
         stats_layout = QHBoxLayout()
         stats_layout.setSpacing(20)
         
-        user_data = self.db.get_user_by_email(self.user_email)
-        all_tasks = self.db.get_all_tasks(self.user_id)
-        completed_count = sum(1 for task in all_tasks if task["status"] == "done")
-        pending_count = sum(1 for task in all_tasks if task["status"] == "pending")
+        user_data = self.db.current_user
+        self._task_counts = self.db.get_status_counts(self.user_id)
+        completed_count = self._task_counts.get("done", 0)
+        pending_count = self._task_counts.get("pending", 0)
+        
+        streak = user_data["streak_days"] if user_data else 0
+        focus = divmod(user_data["total_focus_minutes"], 60) if user_data else (0, 0)
         
         stats_data = [
-            ("","🔥 Streak", f"{user_data['streak_days'] if user_data else 0} days", "#F59E0B"),
-            ("", "⏱️ Focus Time", f"{(user_data['total_focus_minutes']//60) if user_data else 0}h {(user_data['total_focus_minutes']%60) if user_data else 0}m", "#667EEA"),
+            ("","🔥 Streak", self.STAT_FORMATS[0].format(streak), "#F59E0B"),
+            ("", "⏱️ Focus Time", self.STAT_FORMATS[1].format(*focus), "#667EEA"),
             ("", "✅ Completed", f"{completed_count}", "#10B981"),
             ("", "📋 Pending", f"{pending_count}", "#3B82F6")
         ]
+        # Values behind each card's text; the task cards start as bare numbers
+        self._stat_values = [(streak,), focus, None, None]
         
+        self.stat_cards = []
         self.stats_value_labels = []
         
         for icon, title, value, color in stats_data:
             card = StatCard(icon, title, value, color)
+            self.stat_cards.append(card)
             self.stats_value_labels.append(card.value_label)
             stats_layout.addWidget(card)
         
@@ -439,10 +782,8 @@ class FocusPage(QWidget):
         self.circular_progress = ModernCircularProgress(progress_wrapper)
         
         # Time label INSIDE the wrapper
-        self.time_label = QLabel("25:00", progress_wrapper)
-        self.time_label.setFont(QFont("Segoe UI", 70, QFont.Bold))
-        self.time_label.setAlignment(Qt.AlignCenter)
-        self.time_label.setStyleSheet("color: #1E293B; background: transparent;")
+        self.time_label = StaticTextLabel("25:00", QFont("Segoe UI", 70, QFont.Bold), "#1E293B",
+                                          Qt.AlignCenter, progress_wrapper)
         self.time_label.setGeometry(0, 100, 280, 80)
         
         timer_layout.addWidget(progress_wrapper, alignment=Qt.AlignCenter)
@@ -454,31 +795,7 @@ class FocusPage(QWidget):
         
         self.strategy_combo = QComboBox()
         self.strategy_combo.addItems(["🍅 Pomodoro (25 min)", "🧠 Deep Work (90 min)", "⚖️ Balanced (45 min)"])
-        self.strategy_combo.setStyleSheet("""
-            QComboBox {
-                background: #F8FAFC;
-                border: 2px solid #E2E8F0;
-                border-radius: 10px;
-                padding: 12px 16px;
-                color: #1E293B;
-                font-size: 11pt;
-                font-weight: 600;
-            }
-            QComboBox:hover {
-                border: 2px solid #667EEA;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 30px;
-            }
-            QComboBox QAbstractItemView {
-                background: white;
-                color: #1E293B;
-                selection-background-color: #667EEA;
-                border: 1px solid #E2E8F0;
-                border-radius: 8px;
-            }
-        """)
+        self.strategy_combo.setStyleSheet(_COMBO_QSS)
         self.strategy_combo.currentIndexChanged.connect(self.change_strategy)
         
         timer_layout.addWidget(strategy_label, alignment=Qt.AlignCenter)
@@ -498,39 +815,21 @@ class FocusPage(QWidget):
         # Scrollable task list
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                background: transparent;
-                border: none;
-            }
-            QScrollBar:vertical {
-                background: #F1F5F9;
-                width: 8px;
-                border-radius: 4px;
-            }
-            QScrollBar::handle:vertical {
-                background: #CBD5E1;
-                border-radius: 4px;
-            }
-        """)
+        scroll.setStyleSheet(_SCROLL_QSS)
         
         task_list_widget = QWidget()
         self.task_list_layout = QVBoxLayout(task_list_widget)
         self.task_list_layout.setSpacing(12)
-        
-        pending_tasks = self.planner.filter_tasks("pending")
-        if pending_tasks:
-            for task in pending_tasks[:5]:
-                card = ModernTaskCard(task.get_title(), task.get_priority(), task.get_duration())
-                self.task_list_layout.addWidget(card)
-        else:
-            no_tasks = QLabel("No pending tasks ✨")
-            no_tasks.setFont(QFont("Segoe UI", 11))
-            no_tasks.setAlignment(Qt.AlignCenter)
-            no_tasks.setStyleSheet("color: #94A3B8; background: transparent; padding: 30px;")
-            self.task_list_layout.addWidget(no_tasks)
-        
+        self._task_card_by_id = {}
+        self._shown_task_keys = None  # (id, card key) pairs the list last showed
+        
+        self._no_tasks_label = QLabel("No pending tasks ✨")
+        self._no_tasks_label.setFont(QFont("Segoe UI", 11))
+        self._no_tasks_label.setAlignment(Qt.AlignCenter)
+        self._no_tasks_label.setStyleSheet("color: #94A3B8; background: transparent; padding: 30px;")
+        self.task_list_layout.addWidget(self._no_tasks_label)
         self.task_list_layout.addStretch()
+        self.refresh_task_list()
         scroll.setWidget(task_list_widget)
         task_layout.addWidget(scroll)
         timer_section.addWidget(task_container)
@@ -539,66 +838,21 @@ class FocusPage(QWidget):
         
         # Control Buttons
         btn_layout = QHBoxLayout()
-        btn_layout.setSpacing(12)
+        btn_layout.setSpacing(2)  # plus the 5px button margins: 12px between buttons
         
-        self.start_btn = QPushButton("▶ Start")
-        self.pause_btn = QPushButton("⏸ Pause")
-        self.continue_btn = QPushButton("▶ Continue")
+        self.start_btn = _ShadowButton("▶ Start")
+        self.pause_btn = _ShadowButton("⏸ Pause")
+        self.continue_btn = _ShadowButton("▶ Continue")
         self.complete_btn = QPushButton("✅ Complete")
-        self.reset_btn = QPushButton("⟲ Reset")
+        self.reset_btn = _ShadowButton("⟲ Reset")
         
         self.continue_btn.hide()
         self.complete_btn.hide()
         
-        # Button styles
-        default_style = """
-            QPushButton {
-                background: #667EEA;
-                color: white;
-                border: none;
-                border-radius: 12px;
-                padding: 14px 24px;
-                font-size: 12pt;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background: #5568D3;
-            }
-            QPushButton:pressed {
-                background: #4C51BF;
-            }
-        """
-        
-        complete_style = """
-            QPushButton {
-                background: #10B981;
-                color: white;
-                border: none;
-                border-radius: 12px;
-                padding: 14px 24px;
-                font-size: 12pt;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background: #059669;
-            }
-            QPushButton:pressed {
-                background: #047857;
-            }
-        """
-        
-        for btn in [self.start_btn, self.pause_btn, self.continue_btn, self.reset_btn]:
-            btn.setStyleSheet(default_style)
-            btn.setMinimumHeight(50)
-            
-            shadow = QGraphicsDropShadowEffect()
-            shadow.setBlurRadius(15)
-            shadow.setColor(QColor(102, 126, 234, 60))
-            shadow.setOffset(0, 4)
-            btn.setGraphicsEffect(shadow)
-        
-        self.complete_btn.setStyleSheet(complete_style)
-        self.complete_btn.setMinimumHeight(50)
+        # Button styles come from the page stylesheet
+        self.complete_btn.setObjectName("completeButton")
+        for btn in [self.start_btn, self.pause_btn, self.continue_btn, self.complete_btn, self.reset_btn]:
+            btn.setMinimumHeight(60)  # 50px button inside the shadow margin
         
         self.start_btn.clicked.connect(self.start_focus)
         self.pause_btn.clicked.connect(self.pause_focus)
@@ -625,15 +879,23 @@ class FocusPage(QWidget):
         # Time label is now inside progress_wrapper, no need for positioning
     
     def change_strategy(self, index):
-        """Change focus strategy"""
-        strategy_map = {0: "pomodoro", 1: "deepwork", 2: "balanced"}
-        durations = {0: 25, 1: 90, 2: 45}
+        """Queue a strategy change; only the last one within 150 ms is applied"""
+        self._pending_strategy_index = index
+        self._strategy_debounce.start()
+    
+    def _apply_strategy_change(self):
+        """Apply the pending strategy selection"""
+        self._strategy_debounce.stop()
+        index = self._pending_strategy_index
+        if index is None:
+            return
+        self._pending_strategy_index = None
         
-        self.strategy_name = strategy_map[index]
+        self.strategy_name = self.STRATEGY_NAMES[index]
         self.strategy = StrategyFactory.create(self.strategy_name)
         self.planner.set_strategy(self.strategy)
         
-        duration = durations[index]
+        duration = self.STRATEGY_MINUTES[index]
         self.time_label.setText(f"{duration}:00")
         self.status_label.setText(f"✅ Strategy: {self.strategy_name.capitalize()} ({duration} min)")
     
@@ -642,16 +904,20 @@ class FocusPage(QWidget):
         if self.is_running:
             return
         
-        durations = [25, 90, 45]
-        duration = durations[self.strategy_combo.currentIndex()]
+        # Don't start with a strategy change still waiting on the debounce
+        self._apply_strategy_change()
+        
+        duration = self.STRATEGY_MINUTES[self.strategy_combo.currentIndex()]
         
         self.total_duration = duration * 60
         self.remaining_time = self.total_duration
         self.session_start_time = datetime.datetime.now()
+        self._elapsed_before_pause = 0.0
         
         self.planner.execute_strategy()
         
-        self.timer.start(1000)
+        self._run_started = time.monotonic()
+        self._schedule_tick()
         self.is_running = True
         self.is_paused = False
         
@@ -664,6 +930,7 @@ class FocusPage(QWidget):
         """Pause session"""
         if self.is_running:
             self.timer.stop()
+            self._elapsed_before_pause += time.monotonic() - self._run_started
             self.is_running = False
             self.is_paused = True
             self.status_label.setText("⏸ Paused")
@@ -673,7 +940,8 @@ class FocusPage(QWidget):
     def continue_focus(self):
         """Continue session"""
         if self.is_paused:
-            self.timer.start(1000)
+            self._run_started = time.monotonic()
+            self._schedule_tick()
             self.is_running = True
             self.is_paused = False
             self.status_label.setText("🔥 Resumed!")
@@ -684,6 +952,7 @@ class FocusPage(QWidget):
         """Reset session"""
         self.timer.stop()
         self.remaining_time = 0
+        self._last_progress = 0
         self.circular_progress.progress = 0
         self.time_label.setText("25:00")
         self.is_running = False
@@ -696,18 +965,34 @@ class FocusPage(QWidget):
     
     def update_timer(self):
         """Update timer"""
+        elapsed = min(self.total_duration, self._elapsed_seconds())
+        self.remaining_time = self.total_duration - elapsed
         if self.remaining_time > 0:
-            self.remaining_time -= 1
-            elapsed = self.total_duration - self.remaining_time
-            progress = int((elapsed / self.total_duration) * 100)
-            self.circular_progress.progress = progress
+            new_progress = elapsed * 100 // self.total_duration
+            # The percentage holds for many ticks in long sessions; skip the property call
+            if new_progress != self._last_progress:
+                self._last_progress = new_progress
+                self.circular_progress.progress = new_progress
             
-            minutes = self.remaining_time // 60
-            seconds = self.remaining_time % 60
-            self.time_label.setText(f"{minutes:02}:{seconds:02}")
+            self.time_label.setText(self.TIME_STRINGS[self.remaining_time])  # no-op when unchanged
+            if self.is_running:
+                self._schedule_tick()
         else:
             self.complete_session()
     
+    def _schedule_tick(self):
+        """Arm the timer for just after the next whole second of session time"""
+        elapsed = self._elapsed_before_pause + time.monotonic() - self._run_started
+        # Resuming mid-second keeps the display on the session's own second boundaries
+        self.timer.start(int((1 - elapsed % 1) * 1000) + 1)
+    
+    def _elapsed_seconds(self):
+        """Whole seconds the session has been running, read from the monotonic clock"""
+        elapsed = self._elapsed_before_pause
+        if self.is_running:
+            elapsed += time.monotonic() - self._run_started
+        return int(elapsed)
+    
     def complete_session(self):
         """Complete and save session"""
         if not self.is_running and not self.is_paused:
@@ -721,9 +1006,10 @@ class FocusPage(QWidget):
             return
         
         self.timer.stop()
+        elapsed_seconds = min(self.total_duration, self._elapsed_seconds())
+        self.remaining_time = self.total_duration - elapsed_seconds
         self.is_running = False
         
-        elapsed_seconds = self.total_duration - self.remaining_time
         duration_minutes = max(1, int(elapsed_seconds / 60))
         
         if duration_minutes < 1:
@@ -732,21 +1018,38 @@ class FocusPage(QWidget):
             self.reset_focus()
             return
         
-        # Save to database
-        self.db.add_focus_minutes(self.user_id, duration_minutes)
-        self.db.update_streak(self.user_id, datetime.datetime.now().isoformat())
-        self.db.update_average_session(self.user_id)
+        # Save in the background; the UI continues in _on_session_saved
+        self.storage.submit(SessionWriteJob(
+            user_id=self.user_id,
+            minutes=duration_minutes,
+            task_id=self.current_task_id,
+            strategy=self.strategy_name,
+            start_time=self.session_start_time,
+            end_time=datetime.datetime.now(),
+        ))
         
-        if self.session_start_time:
-            self.db.log_session(
-                task_id=self.current_task_id,
-                strategy=self.strategy_name,
-                start_time=self.session_start_time,
-                end_time=datetime.datetime.now(),
-                duration=duration_minutes
-            )
-        
-        user_updated = self.db.get_user_by_email(self.user_email)
+        self.reset_focus()
+        self.status_label.setText("💾 Saving session...")
+    
+    def _emit_session_saved(self, job):
+        """Runs on the storage thread: snapshot the committed user row for the GUI thread"""
+        user = self.db.current_user or self.db.get_user_by_email(self.user_email)
+        if user is None:
+            return
+        try:
+            self.sessionSaved.emit(job.minutes, dict(user))
+        except RuntimeError:
+            pass  # page already destroyed (shutdown)
+    
+    def _emit_session_failed(self, job):
+        """Runs on the storage thread: report a rolled-back write to the GUI thread"""
+        try:
+            self.sessionFailed.emit(job.minutes)
+        except RuntimeError:
+            pass  # page already destroyed (shutdown)
+    
+    def _on_session_saved(self, duration_minutes, user_updated):
+        """Show the result once the background write has been committed"""
         
         self.status_label.setText("✅ Session completed!")
         
@@ -755,27 +1058,41 @@ class FocusPage(QWidget):
             f"🔥 Streak: {user_updated['streak_days']} days\n"
             f"⏱️ Total Focus: {user_updated['total_focus_minutes']//60}h {user_updated['total_focus_minutes']%60}m")
         
-        self.reset_focus()
-        self.load_pending_tasks()
+        self.status_label.setText("Ready to focus 💪")
+        # Resync all four cards (one query), including counts changed on other pages
         self.refresh_stats()
     
+    def _on_session_failed(self, duration_minutes):
+        """Clear the pending "Saving" state and tell the user the session was not stored"""
+        self.status_label.setText("Ready to focus 💪")
+        QMessageBox.warning(self, "❌ Save Failed",
+            f"Your {duration_minutes}-minute session could not be saved. Please try again.")
+    
     def refresh_stats(self):
-        """Refresh statistics"""
-        user_data = self.db.get_user_by_email(self.user_email)
-        all_tasks = self.db.get_all_tasks(self.user_id)
-        completed_count = sum(1 for task in all_tasks if task["status"] == "done")
-        pending_count = sum(1 for task in all_tasks if task["status"] == "pending")
-        
-        total_hours = (user_data['total_focus_minutes']//60) if user_data else 0
-        total_mins = (user_data['total_focus_minutes']%60) if user_data else 0
-        
-        stats_values = [
-            f"{user_data['streak_days'] if user_data else 0} days",
-            f"{total_hours}h {total_mins}m",
-            f"{completed_count} tasks",
-            f"{pending_count} tasks"
-        ]
+        """Refresh statistics (one query for all four cards)"""
+        dashboard = self.db.get_focus_dashboard(self.user_id)
+        completed_count = dashboard["done_count"]
+        pending_count = dashboard["pending_count"]
+        self._task_counts = {"done": completed_count, "pending": pending_count}
         
         if hasattr(self, 'stats_value_labels'):
-            for i, label in enumerate(self.stats_value_labels):
-                label.setText(stats_values[i])
\ No newline at end of file
+            self._set_stat(0, dashboard["streak_days"])
+            self._set_stat(1, *divmod(dashboard["total_focus_minutes"], 60))
+            self._set_stat(2, completed_count)
+            self._set_stat(3, pending_count)
+    
+    def _set_stat(self, index, *values):
+        """Show `values` on one stat card; nothing is formatted or set when they are unchanged"""
+        if self._stat_values[index] != values:
+            self._stat_values[index] = values
+            self.stats_value_labels[index].setText(self.STAT_FORMATS[index].format(*values))
+    
+    def task_status_changed(self, old_status, new_status):
+        """Adjust the cached task counters after a status change elsewhere"""
+        if old_status == new_status:
+            return
+        counts = self._task_counts
+        counts[old_status] = counts.get(old_status, 0) - 1
+        counts[new_status] = counts.get(new_status, 0) + 1
+        self._set_stat(2, counts.get("done", 0))
+        self._set_stat(3, counts.get("pending", 0))
\ No newline at end of file
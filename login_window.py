@@ -2,54 +2,75 @@ from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QLineEdit, QPushButton, QHBoxLayout,
     QVBoxLayout, QFrame, QCheckBox, QMessageBox
 )
-from PyQt5.QtGui import QPainter, QColor, QPixmap, QFont
-from PyQt5.QtCore import Qt, QTimer
-import sys, random
+from PyQt5.QtGui import QPainter, QColor, QPixmap, QFont, QPen
+from PyQt5.QtCore import Qt, QTimer, QLineF
+import sys
 
 
 # 🔹 Yağmur Efektli Arka Plan Widget'ı
 class RainBackground(QWidget):
+    DROP_COUNT = 50  # yağmur damlası sayısı
+
     def __init__(self, image_path):
         super().__init__()
+        import numpy as np  # sadece login ekranının yağmuru NumPy'a ihtiyaç duyar
         self.background = QPixmap(image_path)
-        self.rain_drops = [self.create_drop() for _ in range(50)]  # yağmur damlası sayısı
+        self._scaled_bg = QPixmap()  # resizeEvent'te ölçeklenir, her karede değil
+
+        # Damla durumu paralel diziler halinde (structure of arrays)
+        n = self.DROP_COUNT
+        self.xs = np.random.randint(0, 601, n).astype(np.float32)
+        self.ys = np.random.randint(-400, 1, n).astype(np.float32)
+        self.speeds = np.random.uniform(5, 10, n).astype(np.float32)
+        self.lengths = np.random.randint(10, 21, n).astype(np.float32)
+        self.opacities = np.random.randint(80, 181, n)
+        # Opaklık damla başına sabit: kalemler bir kez hazırlanır
+        self._pens = [QPen(QColor(255, 255, 255, a)) for a in self.opacities.tolist()]
+
         self.timer = QTimer()
-        self.timer.timeout.connect(self.update_rain)
+        self.timer.timeout.connect(self.update_rain)  # showEvent'te başlar
+
+    def showEvent(self, event):
         self.timer.start(40)  # 25 FPS
+        super().showEvent(event)
 
-    def create_drop(self):
-        """Yeni bir yağmur damlası oluşturur."""
-        return {
-            "x": random.randint(0, 600),
-            "y": random.randint(-400, 0),
-            "speed": random.uniform(5, 10),
-            "length": random.randint(10, 20),
-            "opacity": random.randint(80, 180)
-        }
+    def hideEvent(self, event):
+        """Görünmezken yağmur döngüsü boşuna çalışmasın."""
+        self.timer.stop()
+        super().hideEvent(event)
 
     def update_rain(self):
-        """Her karede damlaların pozisyonunu günceller."""
-        for drop in self.rain_drops:
-            drop["y"] += drop["speed"]
-            if drop["y"] > self.height():
-                drop["y"] = random.randint(-100, 0)
-                drop["x"] = random.randint(0, self.width())
+        """Her karede damlaların pozisyonunu tek bir vektörel adımda günceller."""
+        import numpy as np
+        self.ys += self.speeds
+        fallen = self.ys > self.height()
+        count = int(fallen.sum())
+        if count:
+            self.ys[fallen] = np.random.randint(-100, 1, count)
+            self.xs[fallen] = np.random.randint(0, self.width() + 1, count)
         self.update()
 
+    def resizeEvent(self, event):
+        """Arka plan resmini yalnızca boyut değiştiğinde yeniden ölçekler."""
+        self._scaled_bg = self.background.scaled(
+            event.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation
+        )
+        super().resizeEvent(event)
+
     def paintEvent(self, event):
         """Görseli ve damlaları çizer."""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
 
-        # Arka plan resmi
-        scaled_bg = self.background.scaled(self.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-        painter.drawPixmap(0, 0, scaled_bg)
+        # Arka plan resmi (resizeEvent'te hazırlanmış hali)
+        painter.drawPixmap(0, 0, self._scaled_bg)
 
         # Yağmur damlaları
-        for drop in self.rain_drops:
-            color = QColor(255, 255, 255, drop["opacity"])
-            painter.setPen(color)
-            painter.drawLine(drop["x"], drop["y"], drop["x"], drop["y"] + drop["length"])
+        for x, y, length, pen in zip(
+            self.xs.tolist(), self.ys.tolist(), self.lengths.tolist(), self._pens
+        ):
+            painter.setPen(pen)
+            painter.drawLine(QLineF(x, y, x, y + length))
 
 
 # 🔹 Login Arayüzü
@@ -152,6 +173,7 @@ class LoginWindow(QWidget):
             QMessageBox.warning(self, "Error", "Please enter both email and password.")
             return
         if email == "dogukan@example.com" and password == "1234":
+            self.left_frame.timer.stop()  # ana pencereye geçerken yağmur durur
             QMessageBox.information(self, "Success", "Login successful! 🚀")
         else:
             QMessageBox.critical(self, "Error", "Invalid email or password.")
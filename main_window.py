@@ -8,12 +8,18 @@ and expandable structure for task management and focus modes.
 
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLineEdit, QTableWidget, QTableWidgetItem,
+    QPushButton, QLineEdit, QTableView, QStyledItemDelegate,
     QHeaderView, QFrame, QStackedWidget, QMessageBox
 )
-from PyQt5.QtCore import Qt, QSize, QTimer as QTimerCore
-from PyQt5.QtGui import QFont, QPixmap, QIcon, QMovie
+from PyQt5.QtCore import (
+    Qt, QSize, QTimer as QTimerCore, QAbstractTableModel, QModelIndex, QEvent, QRect, pyqtSignal,
+    QRunnable, QThreadPool
+)
+from PyQt5.QtGui import QFont, QFontMetrics, QPixmap, QIcon, QMovie, QPainter, QColor
 import sys
+from collections import Counter
+from functools import lru_cache
+from operator import itemgetter
 from PyQt5.QtWidgets import QGridLayout
 from completed_page import CompletedPage  # en üste ekle
 from focus_page import FocusPage
@@ -21,8 +27,7 @@ from statistics_page import StatisticsPage
 from settings_page import SettingsPage
 from planner_page import PlannerPage
 from database import DatabaseManager
-from PyQt5.QtCore import Qt, QSize, QTimer, QDate
-from database import get_connection
+from PyQt5.QtCore import Qt, QSize, QDate
 from mentor_page import MentorPage
 
 
@@ -31,7 +36,40 @@ from mentor_page import MentorPage
 # ============================================================
 # 🔹 Animated Sidebar Button (supports PNG + GIF hover icons)
 # ============================================================
+@lru_cache(maxsize=64)
+def _load_pixmap(path, w, h):
+    """PNG'yi bir kez okuyup ölçekler; aynı yol/boyut için aynı QPixmap paylaşılır."""
+    return QPixmap(path).scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
 class AnimatedButton(QPushButton):
+    # 🔹 Stiller (mavi çerçeve, beyaz zemin) — sidebar'a bir kez uygulanır
+    _QSS = """
+        QPushButton#animBtn {
+            background-color: #FFFFFF;
+            border: 2px solid transparent;
+            border-radius: 8px;
+            text-align: left;
+            padding: 8px;
+            transition: all 0.2s ease;
+        }
+        QPushButton#animBtn:hover {
+            border: 2px solid #2563EB;
+        }
+        QPushButton#animBtn:hover QLabel {
+            color: #2563EB;
+            font-weight: bold;
+        }
+        QPushButton#animBtn:checked {
+            background-color: #FFFFFF;
+            border: 2px solid #2563EB;
+        }
+        QPushButton#animBtn:checked QLabel {
+            color: #2563EB;
+            font-weight: bold;
+        }
+    """
+
     def __init__(self, text, static_icon, gif_icon, parent=None):
         super().__init__(parent)
         self.text_label = QLabel(text, self)
@@ -44,15 +82,14 @@ class AnimatedButton(QPushButton):
         # 🔹 PNG ve GIF ikonları
         self.icon_label = QLabel(self)
         self.icon_label.setFixedSize(self.icon_size)
-        self.icon_label.setPixmap(QPixmap(static_icon).scaled(self.icon_size, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        self.icon_label.setPixmap(_load_pixmap(static_icon, self.icon_size.width(), self.icon_size.height()))
         self.icon_label.setStyleSheet("background: transparent;")
 
         self.gif_label = QLabel(self)
         self.gif_label.setFixedSize(self.icon_size)
         self.gif_label.setStyleSheet("background: transparent;")
-        self.movie = QMovie(gif_icon)
-        self.movie.setScaledSize(self.icon_size)
-        self.gif_label.setMovie(self.movie)
+        self.gif_icon = gif_icon
+        self.movie = None   # GIF ilk hover'da çözülür
         self.gif_label.hide()
 
         # 🔹 Layout hizalaması
@@ -64,36 +101,16 @@ class AnimatedButton(QPushButton):
         layout.addWidget(self.text_label)
         layout.addStretch()
 
-        # 🔹 Stiller (mavi çerçeve, beyaz zemin)
+        # 🔹 Stiller sidebar çerçevesindeki _QSS'ten gelir (bkz. create_sidebar)
         self.setCheckable(True)
-        self.setStyleSheet("""
-            QPushButton {
-                background-color: #FFFFFF;
-                border: 2px solid transparent;
-                border-radius: 8px;
-                text-align: left;
-                padding: 8px;
-                transition: all 0.2s ease;
-            }
-            QPushButton:hover {
-                border: 2px solid #2563EB;
-            }
-            QPushButton:hover QLabel {
-                color: #2563EB;
-                font-weight: bold;
-            }
-            QPushButton:checked {
-                background-color: #FFFFFF;
-                border: 2px solid #2563EB;
-            }
-            QPushButton:checked QLabel {
-                color: #2563EB;
-                font-weight: bold;
-            }
-        """)
+        self.setObjectName("animBtn")
 
     def enterEvent(self, event):
         """Hover olunca GIF başlat, PNG gizle"""
+        if self.movie is None:
+            self.movie = QMovie(self.gif_icon)
+            self.movie.setScaledSize(self.icon_size)
+            self.gif_label.setMovie(self.movie)
         self.icon_label.hide()
         self.gif_label.show()
         self.movie.start()
@@ -101,17 +118,171 @@ class AnimatedButton(QPushButton):
 
     def leaveEvent(self, event):
         """Hover bitince GIF durur, PNG geri gelir"""
-        self.movie.stop()
+        if self.movie is not None:
+            self.movie.stop()
         self.gif_label.hide()
         self.icon_label.show()
         super().leaveEvent(event)
 
 
+# ============================================================
+# 🔹 Dashboard Görev Tablosu (model + Actions delegate)
+# ============================================================
+class TaskTableModel(QAbstractTableModel):
+    """Dashboard görev tablosunun modeli; hücreler yalnızca çizilirken okunur."""
+    HEADERS = ["Task", "Deadline", "Duration", "Status", "Actions"]
+
+    def __init__(self, tasks, parent=None):
+        super().__init__(parent)
+        self._tasks = [dict(task) for task in tasks]   # durum yerinde güncellenebilsin
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._tasks)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        task = self._tasks[index.row()]
+        column = index.column()
+        if column == 0:
+            return task["title"]
+        if column == 1:
+            return task["deadline"]
+        if column == 2:
+            return f"{task['duration']} min"
+        if column == 3:
+            return "✅ Done" if task["status"] == "done" else "🕒 Pending"
+        return None   # Actions: TaskActionsDelegate çizer
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def task(self, row):
+        return self._tasks[row]
+
+    def tasks(self):
+        return self._tasks
+
+    def set_tasks(self, tasks):
+        """Tabloyu yeni görev satırlarıyla değiştirir (view ve delegate aynı kalır)."""
+        self.beginResetModel()
+        self._tasks = [dict(task) for task in tasks]
+        self.endResetModel()
+
+    def set_status(self, row, status):
+        """Satırın durumunu günceller; yalnızca Status hücresi yeniden çizilir."""
+        self._tasks[row]["status"] = status
+        cell = self.index(row, 3)
+        self.dataChanged.emit(cell, cell, [Qt.DisplayRole])
+
+    def removeRows(self, row, count=1, parent=QModelIndex()):
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._tasks[row:row + count]
+        self.endRemoveRows()
+        return True
+
+
+class TaskActionsDelegate(QStyledItemDelegate):
+    """Actions sütunundaki Toggle / Delete düğmelerini hücre widget'ı kurmadan çizer."""
+    toggleClicked = pyqtSignal(int)   # satır
+    deleteClicked = pyqtSignal(int)
+
+    BUTTONS = (("↩ Toggle", QColor("#3B82F6")), ("✖ Delete", QColor("#EF4444")))
+
+    def _button_font(self, option):
+        font = QFont(option.font)
+        font.setPointSize(9)
+        font.setWeight(QFont.DemiBold)
+        return font
+
+    def _button_rects(self, option):
+        """Hücre içinde (4, 2) kenar boşluğu, 6px aralıkla iki eşit düğme."""
+        inner = option.rect.adjusted(4, 2, -4, -2)
+        height = min(inner.height(), QFontMetrics(self._button_font(option)).height() + 8)
+        top = inner.top() + (inner.height() - height) // 2
+        width = (inner.width() - 6) // 2
+        return (QRect(inner.left(), top, width, height),
+                QRect(inner.left() + width + 6, top, inner.width() - width - 6, height))
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)   # seçim arka planı
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(self._button_font(option))
+        for rect, (text, color) in zip(self._button_rects(option), self.BUTTONS):
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(color)
+            painter.drawRoundedRect(rect, 4, 4)
+            painter.setPen(Qt.white)
+            painter.drawText(rect, Qt.AlignCenter, text)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            toggle_rect, delete_rect = self._button_rects(option)
+            if toggle_rect.contains(event.pos()):
+                self.toggleClicked.emit(index.row())
+                return True
+            if delete_rect.contains(event.pos()):
+                self.deleteClicked.emit(index.row())
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
+# ============================================================
+# 🔹 Dashboard Verisi (arka plan okuması)
+# ============================================================
+class DashboardLoader(QRunnable):
+    """Dashboard sorgularını QThreadPool thread'inde çalıştırır; sonucu on_loaded(ticket, data) ile iletir.
+
+    SQLite bağlantıları thread'e özeldir; get_connection() bu thread için kendi bağlantısını açar.
+    """
+
+    def __init__(self, db, user_id, first_day, ticket, on_loaded):
+        super().__init__()
+        self.db = db
+        self.user_id = user_id
+        self.first_day = first_day
+        self.ticket = ticket
+        self.on_loaded = on_loaded
+
+    def run(self):
+        data = self.db.get_dashboard_data(self.user_id, self.first_day) or {}   # sorgu hatasında None
+        try:
+            self.on_loaded(self.ticket, data)
+        except RuntimeError:
+            pass   # pencere bu arada kapandı
+
+
+# ============================================================
+# 🔹 Günlük Motivasyon Cümlesi
+# ============================================================
+QUOTES = (
+    "Discipline beats motivation every time.",
+    "You don’t need more time, you need more focus.",
+    "Small progress is still progress.",
+    "The secret to getting ahead is getting started.",
+    "Success doesn’t come from what you do occasionally, but what you do consistently.",
+)
+
+
+@lru_cache(maxsize=7)
+def quote_for(weekday):
+    """Haftanın gününe (0-6) düşen sözün etiket metni; her gün için bir kez üretilir."""
+    return f"💬 {QUOTES[weekday % len(QUOTES)]}"
+
 
 # ============================================================
 # 🔹 Main Application Window
 # ============================================================
 class MainWindow(QWidget):
+    dashboardLoaded = pyqtSignal(int, dict)   # (ticket, get_dashboard_data sonucu)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Smart Study Planner")
@@ -140,7 +311,7 @@ class MainWindow(QWidget):
                 padding: 8px;
                 background-color: #FFFFFF;
             }
-            QTableWidget {
+            QTableView {
                 border: 1px solid #E2E8F0;
                 border-radius: 6px;
                 background-color: #FFFFFF;
@@ -154,6 +325,13 @@ class MainWindow(QWidget):
             }
         """)
 
+        # Veritabanı ve oturum kullanıcısı pencere başına bir kez yüklenir;
+        # kullanıcı satırı sonrasında kendi yazmalarımızla yerinde güncellenir (db.current_user)
+        self.db = DatabaseManager()
+        self.user_email = "dogukan@example.com"
+        if self.db.current_user is None:
+            self.db.set_current_user(self.user_email)
+
         # Layout
         main_layout = QHBoxLayout(self)
 
@@ -163,22 +341,28 @@ class MainWindow(QWidget):
         # Pages
         self.stack = QStackedWidget()
         self.dashboard_page = self.create_dashboard_page()
-        self.completed_page = CompletedPage()
-        self.planner_page = PlannerPage()
-        self.focus_page = FocusPage()
-        self.stats_page = StatisticsPage()
-        self.settings_page = SettingsPage()
-        self.mentor_page = MentorPage()
-
+        self.completed_page = None
+        self.planner_page = None
+        self.focus_page = None
+        self.stats_page = None
+        self.mentor_page = None
+        self.settings_page = None
+
+        # Diğer sayfalar ilk açıldıklarında kurulur (bkz. _ensure_page);
+        # o zamana kadar stack'te boş bir yer tutucu durur
+        self._page_factories = {
+            1: ("completed_page", CompletedPage),
+            2: ("planner_page", PlannerPage),
+            3: ("focus_page", FocusPage),
+            4: ("stats_page", StatisticsPage),
+            5: ("mentor_page", MentorPage),
+            6: ("settings_page", SettingsPage),
+        }
 
         # Add pages to stacked widget
         self.stack.addWidget(self.dashboard_page)
-        self.stack.addWidget(self.completed_page)
-        self.stack.addWidget(self.planner_page)
-        self.stack.addWidget(self.focus_page)
-        self.stack.addWidget(self.stats_page)
-        self.stack.addWidget(self.mentor_page)
-        self.stack.addWidget(self.settings_page)
+        for _ in self._page_factories:
+            self.stack.addWidget(QWidget())
         
         # Add sidebar + stack to main layout
         main_layout.addWidget(sidebar)
@@ -212,7 +396,7 @@ class MainWindow(QWidget):
                 background-color: #2563EB;
                 color: white;
             }
-        """)
+        """ + AnimatedButton._QSS)
 
         main_layout = QVBoxLayout(frame)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -224,9 +408,7 @@ class MainWindow(QWidget):
         header_layout.setSpacing(8)
 
         logo_label = QLabel()
-        pixmap = QPixmap("icon_transparent.png")
-        pixmap = pixmap.scaled(72, 72, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        logo_label.setPixmap(pixmap)
+        logo_label.setPixmap(_load_pixmap("icon_transparent.png", 72, 72))
         logo_label.setAlignment(Qt.AlignCenter)
         logo_label.setStyleSheet("background: transparent;")
 
@@ -298,13 +480,14 @@ class MainWindow(QWidget):
     # ============================================================
     def switch_page(self, index):
         """Switch between pages and update button states + AUTO REFRESH"""
+        self._ensure_page(index)
         self.stack.setCurrentIndex(index)
         for i, btn in enumerate(self.buttons):
             btn.setChecked(i == index)
         
         # 🔹 Her sayfa değişiminde o sayfayı yenile
         if index == 0:  # Dashboard
-            self.refresh_dashboard()
+            self.update_dashboard_data()
         elif index == 1:  # Completed Tasks
             self.completed_page.refresh_page()  # ✅ Kartları güncelle
         elif index == 2:  # Planner
@@ -313,24 +496,90 @@ class MainWindow(QWidget):
             self.focus_page.load_pending_tasks()
         elif index == 4:  # Statistics
             self.stats_page.refresh_stats()  # ✅ Her açılışta yenile
+
+    def _ensure_page(self, index):
+        """Sayfa henüz kurulmadıysa kurar ve stack'teki yer tutucusunun yerine koyar."""
+        factory = self._page_factories.pop(index, None)
+        if factory is None:
+            return
+        attr, page_class = factory
+        page = page_class()
+        placeholder = self.stack.widget(index)
+        self.stack.insertWidget(index, page)
+        self.stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        setattr(self, attr, page)
             
-    def refresh_dashboard(self):
-        """Dashboard'u tamamen yeniden oluştur"""
-        # Eski dashboard'u kaldır
-        old_dashboard = self.stack.widget(0)
-        self.stack.removeWidget(old_dashboard)
-        old_dashboard.deleteLater()
-        
-        # Yeni dashboard oluştur
-        self.dashboard_page = self.create_dashboard_page()
-        self.stack.insertWidget(0, self.dashboard_page)
-        self.stack.setCurrentIndex(0)
+    def update_dashboard_data(self):
+        """Dashboard sorgularını arka planda başlatır; sonuç _populate_dashboard ile GUI thread'ine döner."""
+        from datetime import date, timedelta
+
+        # Yeni istek öncekileri geçersiz kılır: geç gelen eski sonuç çizilmez
+        self._dashboard_ticket += 1
+        user = self.db.current_user
+        if user is None:   # kullanıcı başka bir sayfada sonradan oluşturulmuş olabilir
+            user = self.db.set_current_user(self.user_email)
+        first_day = (date.today() - timedelta(days=6)).isoformat()
+        QThreadPool.globalInstance().start(DashboardLoader(
+            self.db, user["id"] if user else None, first_day, self._dashboard_ticket, self.dashboardLoaded.emit
+        ))
+
+    def _populate_dashboard(self, ticket, data):
+        """Arka plan okumasının sonucunu sayfaya yazar; grafik ve tablo yerinde güncellenir."""
+        from datetime import date
+
+        if ticket != self._dashboard_ticket or not data:
+            return   # eski istek ya da okuma hatası: önceki içerik kalır
+        self._dashboard_shown_ticket = ticket
+
+        user = self.db.current_user
+        all_tasks = data["tasks"]
+
+        total_focus_time = user["total_focus_minutes"] if user else 0
+        streak_days = user["streak_days"] if user else 0
+        self._dashboard_focus_minutes = total_focus_time
+
+        # --- Kartlar + tablo ---
+        self._task_model.set_tasks(all_tasks)
+        card_texts = self.task_card_texts(all_tasks, total_focus_time)
+        card_texts["🧠 Total Focus Time"] = f"{total_focus_time//60}h {total_focus_time%60}m"
+        card_texts["🔥 Streak Days"] = str(streak_days)
+        for title, text in card_texts.items():
+            label = self._dashboard_card_labels[title]
+            if label.text() != text:
+                label.setText(text)
+
+        # --- Grafik: aynı bar/çizgi/etiket nesneleri yeni değerlerle ---
+        # Boş günler SQL'de 0 ile dolar
+        daily_rows = data["daily_focus"]
+        focus_minutes = [row["focus_minutes"] for row in daily_rows]
+
+        ax = self._dashboard_ax
+        # Tarihleri kullanıcı dostu biçimde göster (örneğin 'Mon', 'Tue')
+        ax.set_xticklabels([date.fromisoformat(row["date"]).strftime("%a") for row in daily_rows])
+        for bar, text, yval in zip(self._dashboard_bars, self._dashboard_bar_texts, focus_minutes):
+            bar.set_height(yval)
+            text.set_y(yval + 2)
+            text.set_text(f"{int(yval)}")
+            text.set_visible(yval > 0)
+
+        avg = sum(focus_minutes) / len(focus_minutes)
+        self._dashboard_avg_line.set_ydata([avg, avg])
+        self._dashboard_avg_line.set_label(f"Avg: {int(avg)}m")
+        ax.get_legend().get_texts()[0].set_text(f"Avg: {int(avg)}m")
+        ax.relim()
+        ax.autoscale_view()
+        self._dashboard_canvas.draw_idle()
+
+        # --- Günün sözü (gün değişmiş olabilir) ---
+        quote = quote_for(date.today().weekday())
+        if self._quote_label.text() != quote:
+            self._quote_label.setText(quote)
 
     # ============================================================
     # 🔸 Dashboard Page (with Chart, Focus Ratio, Pomodoro Stats)
     # ============================================================
     def create_dashboard_page(self):
-        import datetime
         from PyQt5.QtWidgets import QGridLayout
         from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
         from matplotlib.figure import Figure
@@ -352,24 +601,10 @@ class MainWindow(QWidget):
         top_section = QHBoxLayout()
         top_section.setSpacing(25)
 
-        # --- Veritabanı bağlantısı ---
-        self.db = DatabaseManager()
-        user = self.db.get_user_by_email("dogukan@example.com")
-        user_id = user["id"] if user else None
-
-        # --- Görev verileri ---
-        all_tasks = self.db.get_all_tasks(user_id) if user_id else []
-        completed_tasks = self.db.get_completed_tasks(user_id) if user_id else []
-
-        total_focus_time = user["total_focus_minutes"] if user else 0
-        planned_tasks_count = len(all_tasks)
-        completed_tasks_count = len(completed_tasks)
-        streak_days = user["streak_days"] if user else 0
-
-        # 🔹 Basit hesaplamalar
-        planned_time = sum([t["duration"] for t in all_tasks]) if all_tasks else 1
-        focus_ratio = int((total_focus_time / planned_time) * 100) if planned_time > 0 else 0
-        task_efficiency = int((completed_tasks_count / planned_tasks_count) * 100) if planned_tasks_count > 0 else 0
+        # --- Veri update_dashboard_data ile arka planda dolar ---
+        self._dashboard_ticket = 0
+        self._dashboard_shown_ticket = 0
+        self.dashboardLoaded.connect(self._populate_dashboard)
 
         # ============================================================
         # 🔸 Grafik (Son 7 Günlük Gerçek Focus Süresi)
@@ -386,53 +621,32 @@ class MainWindow(QWidget):
         chart_layout = QVBoxLayout(chart_frame)
         chart_layout.setContentsMargins(15, 15, 15, 15)
         
+        # Figure/Canvas bir kez kurulur; her yenilemede yalnızca bar yükseklikleri değişir
         fig = Figure(figsize=(5, 2))
         canvas = FigureCanvas(fig)
         ax = fig.add_subplot(111)
-        
-        # 🔹 Gerçek veriyi daily_focus tablosundan çekelim
-        from datetime import date, timedelta
-        
-        today = date.today()
-        last_7_days = [(today - timedelta(days=i)).isoformat() for i in range(6, -1, -1)]
-        daily_data = {day: 0 for day in last_7_days}
-        
-        with get_connection() as conn:
-            c = conn.cursor()
-            c.execute("""
-                SELECT date, focus_minutes
-                FROM daily_focus
-                WHERE user_id = ?
-                  AND date BETWEEN ? AND ?
-                ORDER BY date ASC
-            """, (user_id, last_7_days[0], last_7_days[-1]))
-            rows = c.fetchall()
-            for row in rows:
-                daily_data[row["date"]] = row["focus_minutes"]
-        
-        # 🔹 Tarihleri kullanıcı dostu biçimde göster (örneğin 'Mon', 'Tue')
-        import datetime
-        days_labels = [datetime.datetime.fromisoformat(d).strftime("%a") for d in last_7_days]
-        focus_minutes = list(daily_data.values())
+        positions = range(7)
         
         # 🔹 Grafik çizimi
-        bars = ax.bar(days_labels, focus_minutes, color="#3B82F6", edgecolor="#1E3A8A", width=0.55)
+        bars = ax.bar(positions, [0] * 7, color="#3B82F6", edgecolor="#1E3A8A", width=0.55)
+        ax.set_xticks(positions)
         ax.set_title("Last 7 Days Focus Time (minutes)", fontsize=10, color="#1E3A8A")
         ax.set_ylabel("Minutes", fontsize=9)
         ax.grid(axis="y", linestyle="--", alpha=0.4)
         
         # 🔹 Ortalama çizgisi
-        if focus_minutes:
-            avg = sum(focus_minutes) / len(focus_minutes)
-            ax.axhline(avg, color="#F97316", linestyle="--", linewidth=1.5, label=f"Avg: {int(avg)}m")
-            ax.legend(fontsize=8, loc="upper right")
+        self._dashboard_avg_line = ax.axhline(0, color="#F97316", linestyle="--", linewidth=1.5, label="Avg: 0m")
+        ax.legend(fontsize=8, loc="upper right")
         
-        # 🔹 Bar üstü değer etiketleri
-        for bar in bars:
-            yval = bar.get_height()
-            if yval > 0:
-                ax.text(bar.get_x() + bar.get_width()/2, yval + 2, f"{int(yval)}",
-                        ha='center', va='bottom', fontsize=8, color="#1E3A8A")
+        # 🔹 Bar üstü değer etiketleri (0 olan günlerde gizli)
+        self._dashboard_bar_texts = [
+            ax.text(bar.get_x() + bar.get_width()/2, 2, "",
+                    ha='center', va='bottom', fontsize=8, color="#1E3A8A")
+            for bar in bars
+        ]
+        self._dashboard_ax = ax
+        self._dashboard_bars = bars
+        self._dashboard_canvas = canvas
         
         chart_layout.addWidget(canvas)
         top_section.addWidget(chart_frame)
@@ -468,20 +682,23 @@ class MainWindow(QWidget):
             label_value.setFont(QFont("Segoe UI", 12, QFont.Bold))
             card_layout.addWidget(label_title)
             card_layout.addWidget(label_value)
+            self._dashboard_card_labels[title_text] = label_value
             return frame
 
+        # Kartların değer etiketleri: yenilemede yalnızca metni değişenler yazılır
+        self._dashboard_card_labels = {}
         cards = [
-            ("✅ Completed Tasks", str(completed_tasks_count), "#10B981"),
-            ("🗓️ Planned Tasks", str(planned_tasks_count), "#F59E0B"),
-            ("🎯 Focus Ratio", f"{focus_ratio}%", "#6366F1"),
-            ("⚡ Task Efficiency", f"{task_efficiency}%", "#14B8A6"),
-            ("🧠 Total Focus Time", f"{total_focus_time//60}h {total_focus_time%60}m", "#F97316"),
-            ("🔥 Streak Days", str(streak_days), "#3B82F6"),
+            ("✅ Completed Tasks", "#10B981"),
+            ("🗓️ Planned Tasks", "#F59E0B"),
+            ("🎯 Focus Ratio", "#6366F1"),
+            ("⚡ Task Efficiency", "#14B8A6"),
+            ("🧠 Total Focus Time", "#F97316"),
+            ("🔥 Streak Days", "#3B82F6"),
         ]
 
         row, col = 0, 0
-        for title, value, color in cards:
-            card = create_stat_card(title, value, color)
+        for title, color in cards:
+            card = create_stat_card(title, "", color)
             grid_layout.addWidget(card, row, col)
             col += 1
             if col > 1:
@@ -496,14 +713,21 @@ class MainWindow(QWidget):
         # ============================================================
         # 🔹 Görev Tablosu (Veritabanından)
         # ============================================================
-        task_table = QTableWidget(0, 5)
-        task_table.setHorizontalHeaderLabels(["Task", "Deadline", "Duration", "Status", "Actions"])
+        # Satırlar modelde durur; Actions düğmeleri hücre widget'ı değil, delegate çizimi
+        task_model = TaskTableModel([], page)
+        self._task_model = task_model
+        task_table = QTableView()
+        task_table.setModel(task_model)
         task_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         task_table.setColumnWidth(4, 150)
+        actions = TaskActionsDelegate(task_table)
+        actions.toggleClicked.connect(lambda row: self.toggle_task_status(task_model, row))
+        actions.deleteClicked.connect(lambda row: self.delete_task(task_model, row))
+        task_table.setItemDelegateForColumn(4, actions)
         layout.addWidget(task_table)
 
         task_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #FFFFFF;
                 border: 1px solid #E2E8F0;
                 border-radius: 6px;
@@ -513,62 +737,13 @@ class MainWindow(QWidget):
                 background-color: #F1F5F9;
                 font-weight: bold;
             }
-            QPushButton {
-                border: none;
-                border-radius: 4px;
-                padding: 4px 8px;
-                font-size: 9pt;
-                color: white;
-            }
-            QPushButton:hover {
-                opacity: 0.8;
-            }
         """)
 
-        # --- Veritabanından satırları ekle ---
-        for row, task in enumerate(all_tasks):
-            task_table.insertRow(row)
-            task_table.setItem(row, 0, QTableWidgetItem(task["title"]))
-            task_table.setItem(row, 1, QTableWidgetItem(task["deadline"]))
-            task_table.setItem(row, 2, QTableWidgetItem(f"{task['duration']} min"))
-            status_icon = "✅ Done" if task["status"] == "done" else "🕒 Pending"
-            task_table.setItem(row, 3, QTableWidgetItem(status_icon))
-
-            # --- Actions sütunu ---
-            action_widget = QWidget()
-            action_layout = QHBoxLayout(action_widget)
-            action_layout.setContentsMargins(4, 2, 4, 2)
-            action_layout.setSpacing(6)
-
-            # Durum Değiştir Butonu
-            toggle_btn = QPushButton("↩ Toggle")
-            toggle_btn.setStyleSheet("background-color: #3B82F6;")
-            toggle_btn.clicked.connect(lambda _, t=task["id"], r=row: self.toggle_task_status(t, r, task_table))
-
-            # Sil Butonu
-            del_btn = QPushButton("✖ Delete")
-            del_btn.setStyleSheet("background-color: #EF4444;")
-            del_btn.clicked.connect(lambda _, t=task["id"], r=row: self.delete_task(t, r, task_table))
-
-            action_layout.addWidget(toggle_btn)
-            action_layout.addWidget(del_btn)
-            action_widget.setLayout(action_layout)
-            task_table.setCellWidget(row, 4, action_widget)
-
         # ============================================================
         # 🔹 Günlük Motivasyon Cümlesi
         # ============================================================
-        quotes = [
-            "Discipline beats motivation every time.",
-            "You don’t need more time, you need more focus.",
-            "Small progress is still progress.",
-            "The secret to getting ahead is getting started.",
-            "Success doesn’t come from what you do occasionally, but what you do consistently."
-        ]
-        day_index = datetime.datetime.now().weekday() % len(quotes)
-        daily_quote = quotes[day_index]
-
-        quote_label = QLabel(f"💬 {daily_quote}")
+        quote_label = QLabel()
+        self._quote_label = quote_label
         quote_label.setWordWrap(True)
         quote_label.setAlignment(Qt.AlignCenter)
         quote_label.setStyleSheet("""
@@ -583,28 +758,70 @@ class MainWindow(QWidget):
         """)
         layout.addWidget(quote_label)
 
+        self.update_dashboard_data()
         return page
 
 
     # ============================================================
     # 🔸 Yardımcı Fonksiyonlar (Dashboard içinde)
     # ============================================================
-    def toggle_task_status(self, task_id, row, table):
-        """Görev durumunu değiştirir (done/pending)."""
-        task_item = table.item(row, 3)
-        current = task_item.text()
-        new_status = "done" if "Pending" in current else "pending"
-        self.db.update_task_status(task_id, new_status)
-        task_item.setText("✅ Done" if new_status == "done" else "🕒 Pending")
-        
-        QTimer.singleShot(500, self.refresh_dashboard)
+    @staticmethod
+    def task_card_texts(tasks, total_focus_time):
+        """Görev satırlarına bağlı dört dashboard kartının metinleri (tek geçişte sayılır)."""
+        status_counts = Counter(map(itemgetter("status"), tasks))
+        planned_tasks_count = len(tasks)
+        completed_tasks_count = status_counts["done"]
 
-    def delete_task(self, task_id, row, table):
+        # 🔹 Basit hesaplamalar
+        planned_time = sum(map(itemgetter("duration"), tasks)) if tasks else 1
+        focus_ratio = int((total_focus_time / planned_time) * 100) if planned_time > 0 else 0
+        task_efficiency = int((completed_tasks_count / planned_tasks_count) * 100) if planned_tasks_count > 0 else 0
+        return {
+            "✅ Completed Tasks": str(completed_tasks_count),
+            "🗓️ Planned Tasks": str(planned_tasks_count),
+            "🎯 Focus Ratio": f"{focus_ratio}%",
+            "⚡ Task Efficiency": f"{task_efficiency}%",
+        }
+
+    def update_task_cards(self, model):
+        """Tablo değişince sayfayı yeniden kurmadan yalnızca değişen kart metinlerini yazar."""
+        texts = self.task_card_texts(model.tasks(), self._dashboard_focus_minutes)
+        for title, text in texts.items():
+            label = self._dashboard_card_labels[title]
+            if label.text() != text:
+                label.setText(text)
+
+    def toggle_task_status(self, model, row):
+        """Görev durumunu değiştirir (done/pending)."""
+        task = model.task(row)
+        old_status = task["status"]
+        new_status = "pending" if old_status == "done" else "done"
+        # Yazma başarısızsa (get_connection hatayı yutar, None döner) tablo ve sayaçlar olduğu gibi kalır
+        if not self.db.update_task_status(task["id"], new_status):
+            QMessageBox.warning(self, "❌ Update Failed",
+                f"'{task['title']}' could not be updated. Please try again.")
+            return
+        if self.focus_page is not None:   # kurulmadıysa ilk açılışta sayaçları DB'den okur
+            self.focus_page.task_status_changed(old_status, new_status)
+        model.set_status(row, new_status)
+        self.update_task_cards(model)
+        self._reload_if_stale()
+
+    def delete_task(self, model, row):
         """Görevi siler (veritabanı + tablo)."""
-        self.db.delete_task(task_id)
-        table.removeRow(row)
-        
-        QTimer.singleShot(500, self.refresh_dashboard)
+        task = model.task(row)
+        if not self.db.delete_task(task["id"]):
+            QMessageBox.warning(self, "❌ Delete Failed",
+                f"'{task['title']}' could not be deleted. Please try again.")
+            return
+        model.removeRows(row, 1)
+        self.update_task_cards(model)
+        self._reload_if_stale()
+
+    def _reload_if_stale(self):
+        """Yolda olan bir okuma bu yazmadan önce başlamış olabilir; sonucunu yenisiyle değiştir."""
+        if self._dashboard_shown_ticket != self._dashboard_ticket:
+            self.update_dashboard_data()
     
     # ============================================================
     # 🔸 Placeholder Pages
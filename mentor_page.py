@@ -312,10 +312,10 @@ class MentorPage(QWidget):
         score += min(30, total_focus // 60)
         
         # 3. Task completion rate (20 points max)
-        all_tasks = self.db.get_all_tasks(self.user_id)
-        if all_tasks:
-            completed = sum(1 for t in all_tasks if t["status"] == "done")
-            completion_rate = completed / len(all_tasks)
+        status_counts = self.db.get_status_counts(self.user_id)
+        total_tasks = sum(status_counts.values())
+        if total_tasks:
+            completion_rate = status_counts.get("done", 0) / total_tasks
             score += int(completion_rate * 20)
         
         # 4. 7-day activity (20 points max)
@@ -445,8 +445,7 @@ class MentorPage(QWidget):
     def generate_recommendations(self, score, trend, avg_session):
         """Generate actionable recommendations"""
         recommendations = []
-        all_tasks = self.db.get_all_tasks(self.user_id)
-        pending = sum(1 for t in all_tasks if t["status"] == "pending")
+        pending = self.db.get_status_counts(self.user_id).get("pending", 0)
         
         # Strategy recommendations
         if avg_session < 25:
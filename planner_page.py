@@ -26,7 +26,7 @@ Kullanıcı görevlerini kalıcı olarak kaydeder, listeler, siler ve günceller
 | `task["id"]`, `["title"]`, `["priority"]`, `["deadline"]`, `["duration"]`, `["strategy"]`, `["status"]` | Veritabanı sütunları | Her görev kaydının birebir alanları |
 | `add_task()`                 | Frontend fonksiyonu                    | Kullanıcı girdilerini alır, DB’ye kaydeder |
 | `load_tasks()`               | Frontend fonksiyonu                    | Veritabanındaki görevleri tabloya yükler |
-| `insert_task_row(task)`      | UI fonksiyonu                          | Tek bir görevi tabloya satır olarak ekler |
+| `insert_task_row(task, row)` | UI fonksiyonu                          | Tek bir görevi tabloya satır olarak yazar (`load_tasks` satırları önceden açar) |
 | `mark_done(task_id)`         | Backend bağlantılı fonksiyon           | Görevi tamamlanmış olarak işaretler |
 | `delete_task(task_id)`       | Backend bağlantılı fonksiyon           | Görevi veritabanından siler |
 | `"pending"`, `"done"`        | Sabit değer                            | Görev durumları |
@@ -233,8 +233,12 @@ class PlannerPage(QWidget):
         """Tüm görevleri veritabanından çeker ve tabloya ekler."""
         self.table.setRowCount(0)  # ✅ Önce tabloyu temizle
         tasks = self.db.get_all_tasks(self.user_id)
-        for task in tasks:
-            self.insert_task_row(task)
+        # Satırlar tek seferde açılır; doldurma bitene kadar tablo yeniden çizilmez
+        self.table.setUpdatesEnabled(False)
+        self.table.setRowCount(len(tasks))
+        for row, task in enumerate(tasks):
+            self.insert_task_row(task, row)
+        self.table.setUpdatesEnabled(True)
 
     # ============================================================
     # 🔹 Görev Ekleme
@@ -277,9 +281,11 @@ class PlannerPage(QWidget):
     # ============================================================
     # 🔹 Tabloya Satır Ekle
     # ============================================================
-    def insert_task_row(self, task):
-        row = self.table.rowCount()
-        self.table.insertRow(row)
+    def insert_task_row(self, task, row=None):
+        """Görevi verilen satıra yazar; row verilmezse tablonun sonuna yeni satır ekler."""
+        if row is None:
+            row = self.table.rowCount()
+            self.table.insertRow(row)
 
         self.table.setItem(row, 0, QTableWidgetItem(str(task["id"])))
         self.table.setItem(row, 1, QTableWidgetItem(task["title"]))
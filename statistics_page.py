@@ -19,7 +19,6 @@ It connects directly to the database and aggregates multiple tables
 | `self.user`                         | `User("dogukanavci", user_email)`                         | 🔸 Local Object                  | High-level user object for planner integration. |
 | `self.strategy`                     | `StrategyFactory.create("pomodoro")`                      | 🔸 Local Object                  | Current focus strategy (Pomodoro/DeepWork/Balanced). |
 | `self.planner`                      | `Planner(self.user, self.strategy)`                       | 🔸 Local Object                  | Task management and statistics interface. |
-| `db_tasks`                          | `db.get_all_tasks(user_id)`                               | 🔹 Database Query                | Retrieves all tasks (pending, completed). |
 | `completed_tasks`                   | `db.get_completed_tasks(user_id)`                         | 🔹 Database Query                | Retrieves only completed tasks for performance calculation. |
 | `stats`                             | `db.get_user_stats(user_id)`                              | 🔹 Database Query                | Optional aggregated statistics (average session, weekly score, etc.). |
 | `total_minutes`                     | `user["total_focus_minutes"]`                             | 🔹 Database Field                | Total focus time in minutes from users table. |
@@ -28,8 +27,8 @@ It connects directly to the database and aggregates multiple tables
 | `streak`                            | `user["streak_days"]`                                     | 🔹 Database Field                | Number of consecutive focus days. |
 | `avg_session`                       | `stats["average_session"]`                                | 🔹 Database Field                | Average focus session duration (minutes). |
 | `weekly_score`                      | `stats["weekly_score"]`                                   | 🔹 Database Field                | Performance score of the user (0–10 scale). |
-| `total_tasks_count`                 | `len(all_tasks)`                                          | 🔸 Calculated Local              | Number of total tasks created by user. |
-| `completed_count`                   | `len(completed_tasks)`                                    | 🔸 Calculated Local              | Number of completed tasks. |
+| `total_tasks_count`                 | `sum(db.get_status_counts(user_id).values())`             | 🔸 Calculated Local              | Number of total tasks created by user. |
+| `completed_count`                   | `db.get_status_counts(user_id)["done"]`                   | 🔸 Calculated Local              | Number of completed tasks. |
 | `completion_rate`                   | `(completed_count / total_tasks_count) * 100`             | 🔸 Calculated Local              | Percentage of completed tasks. |
 | `best_day`                          | `db.get_best_day(user_id)`                                | 🔹 Database Query                | Day with highest focus minutes. |
 | `cards_data`                        | Local list combining all metrics                          | 🔸 Local Data Structure (list)   | Prepared dataset for UI stat cards. |
@@ -55,20 +54,20 @@ It connects directly to the database and aggregates multiple tables
 - Average session and weekly scores are persisted in `user_stats` table.  
 - Task completion, streaks, and focus duration are synced with the main `users` table.  
 - Charts (`matplotlib`) visualize focus distribution and strategy usage dynamically.  
-- `refresh_stats()` can be called externally to reload the entire page with updated values.
+- `refresh_stats()` can be called externally to reload the entire page with updated values.  
+- The page builds nothing until it is first shown, so `matplotlib` is only imported when the charts are first drawn.
 
 """
 
 
 import random
+from operator import itemgetter
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QProgressBar,
     QGraphicsDropShadowEffect, QGridLayout
 )
 from PyQt5.QtGui import QFont, QColor
-from PyQt5.QtCore import Qt, QPropertyAnimation, QRect, QEasingCurve
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
+from PyQt5.QtCore import Qt, QPropertyAnimation, QRect, QEasingCurve, QTimer
 
 # Backend Integration
 from database import DatabaseManager
@@ -92,20 +91,7 @@ class StatisticsPage(QWidget):
         self.strategy = StrategyFactory.create("pomodoro")
         self.planner = Planner(self.user, self.strategy)
         
-        # Load tasks into planner
-        self.load_tasks_to_planner()
-        
-        self.init_ui()
-
-    def load_tasks_to_planner(self):
-        """Load tasks from database into Planner for statistics"""
-        if not self.user_id:
-            return
-        
-        db_tasks = self.db.get_all_tasks(self.user_id)
-        for db_task in db_tasks:
-            # Skip loading, just use for statistics
-            pass
+        # The UI (and matplotlib with it) is built on the first showEvent / refresh_stats
 
     def init_ui(self):
         layout = QVBoxLayout(self)
@@ -149,12 +135,11 @@ class StatisticsPage(QWidget):
         # ==========================================================
         # 🔹 Gerçek veriler (users + user_stats senkron)
         # ==========================================================
-        user = self.db.get_user_by_email(self.user_email)
+        user = self.user_data   # __init__ / refresh_stats az önce yükledi
         stats = self.db.get_user_stats(self.user_id) if self.user_id else {}
         
-        # --- Görev verileri ---
-        all_tasks = self.db.get_all_tasks(self.user_id) if self.user_id else []
-        completed_tasks = self.db.get_completed_tasks(self.user_id) if self.user_id else []
+        # --- Görev verileri (SQL'de duruma göre sayılır, satırlar yüklenmez) ---
+        status_counts = self.db.get_status_counts(self.user_id) if self.user_id else {}
         
         # --- Kullanıcı tablosundan çekilen veriler (her zaman güncel) ---
         total_minutes = user["total_focus_minutes"] if user else 0
@@ -167,8 +152,8 @@ class StatisticsPage(QWidget):
         weekly_score = stats.get("weekly_score", 0) if stats else 0
         
         # --- Görev istatistikleri ---
-        total_tasks_count = len(all_tasks)
-        completed_count = len(completed_tasks)
+        total_tasks_count = sum(status_counts.values())
+        completed_count = status_counts.get("done", 0)
         completion_rate = int((completed_count / total_tasks_count * 100)) if total_tasks_count > 0 else 0
         
         # --- En iyi gün (opsiyonel) ---
@@ -383,6 +368,9 @@ class StatisticsPage(QWidget):
     # 🔹 Weekly Focus Chart (Real Data from Database)
     # ==========================================================
     def create_weekly_chart(self):
+        # matplotlib is imported when the first chart is drawn, not at app start
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
         fig = Figure(figsize=(6, 3.5))
         canvas = FigureCanvas(fig)
         ax = fig.add_subplot(111)
@@ -420,6 +408,8 @@ class StatisticsPage(QWidget):
     # 🔹 Strategy Distribution Chart (Real Data)
     # ==========================================================
     def create_pie_chart(self):
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
         fig = Figure(figsize=(4, 3))
         canvas = FigureCanvas(fig)
         ax = fig.add_subplot(111)
@@ -466,7 +456,7 @@ class StatisticsPage(QWidget):
         if not weekly_data or len(weekly_data) == 0:
             return "N/A"
         
-        best = max(weekly_data, key=lambda x: x["focus_minutes"])
+        best = max(weekly_data, key=itemgetter("focus_minutes"))
         return best["day"]
 
     # ==========================================================
@@ -538,13 +528,14 @@ class StatisticsPage(QWidget):
         # Get metrics
         total_hours = self.db.get_user_stats(self.user_id).get("total_focus_hours", 0)
         streak = self.user_data["streak_days"] if self.user_data else 0
-        all_tasks = self.db.get_all_tasks(self.user_id)
-        completed = self.db.get_completed_tasks(self.user_id)
+        status_counts = self.db.get_status_counts(self.user_id)
+        total_tasks = sum(status_counts.values())
+        completed = status_counts.get("done", 0)
         
         # Calculate components
         focus_score = min(4, (total_hours / 10) * 4)  # Max 4 points for 10+ hours
         streak_score = min(3, (streak / 7) * 3)       # Max 3 points for 7+ day streak
-        completion_score = 3 * (len(completed) / len(all_tasks)) if all_tasks else 0  # Max 3 points
+        completion_score = 3 * (completed / total_tasks) if total_tasks else 0  # Max 3 points
         
         total_score = int(focus_score + streak_score + completion_score)
         return max(1, min(10, total_score))
@@ -558,5 +549,16 @@ class StatisticsPage(QWidget):
         self.user_data = self.db.get_user_by_email(self.user_email)
         
         # Recreate entire UI with fresh data
-        QWidget().setLayout(self.layout())
-        self.init_ui()
\ No newline at end of file
+        if self.layout() is not None:
+            QWidget().setLayout(self.layout())
+        self.init_ui()
+
+    def showEvent(self, event):
+        """Build the page the first time it is shown"""
+        super().showEvent(event)
+        # switch_page refreshes right after showing the page; only build if nothing did
+        QTimer.singleShot(0, self._build_if_empty)
+
+    def _build_if_empty(self):
+        if self.layout() is None:
+            self.refresh_stats()
\ No newline at end of file
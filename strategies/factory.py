@@ -11,23 +11,26 @@ from strategies import PomodoroStrategy, DeepWorkStrategy, BalancedStrategy
 from strategies.strategy_base import StudyStrategy
 
 
+# Built once at import instead of on every create() call
+_STRATEGIES = {
+    "pomodoro": PomodoroStrategy,
+    "deepwork": DeepWorkStrategy,
+    "balanced": BalancedStrategy,
+}
+
+
 class StrategyFactory:
     """Factory class to create study strategies dynamically."""
 
     @staticmethod
     def create(strategy_name: str) -> StudyStrategy:
-        """Return an instance of a strategy based on its name."""
-        strategies = {
-            "pomodoro": PomodoroStrategy,
-            "deepwork": DeepWorkStrategy,
-            "balanced": BalancedStrategy,
-        }
-
+        """Return a new instance of a strategy based on its name."""
         key = strategy_name.lower().strip()
-        if key not in strategies:
+        strategy_class = _STRATEGIES.get(key)
+        if strategy_class is None:
             raise ValueError(
-                f"❌ Unknown strategy '{strategy_name}'. Valid options: {list(strategies.keys())}"
+                f"❌ Unknown strategy '{strategy_name}'. Valid options: {list(_STRATEGIES.keys())}"
             )
 
         # ✅ Bu satır nesne oluşturma (object instantiation)
-        return strategies[key]()
+        return strategy_class()
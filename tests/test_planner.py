@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""Tests for the Planner's sorted task views."""
+
+import unittest
+from datetime import datetime
+
+from core.planner import Planner
+from core.task import Task
+from core.user import User
+
+
+class PlannerSortTests(unittest.TestCase):
+    def setUp(self):
+        self.planner = Planner(User("tester", "tester@example.com"), strategy=None)
+
+    def test_tasks_without_deadline_sort_last(self):
+        undated_a = Task(1, 2, "Read", None, 30)
+        undated_b = Task(2, 1, "Review", None, 45)
+        dated = Task(3, 3, "Exam prep", datetime(2025, 10, 20), 60)
+
+        for task in (undated_a, undated_b, dated):
+            self.planner.add_task(task)
+
+        by_deadline = self.planner.sort_tasks(by_deadline=True)
+        self.assertIs(by_deadline[0], dated)
+        self.assertCountEqual(by_deadline[1:], [undated_a, undated_b])
+        self.assertEqual(
+            [t.get_priority() for t in self.planner.sort_tasks(by_deadline=False)], [1, 2, 3]
+        )
+
+    def test_reschedule_to_no_deadline(self):
+        dated = Task(1, 1, "Essay", datetime(2025, 10, 18), 30)
+        later = Task(2, 2, "Lab", datetime(2025, 10, 25), 30)
+        planner = Planner(User("tester", "tester@example.com"), None, [dated, later])
+
+        dated.reschedule(None)
+
+        self.assertEqual(planner.sort_tasks(), [later, dated])
+
+
+if __name__ == "__main__":
+    unittest.main()